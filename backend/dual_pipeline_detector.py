@@ -8,7 +8,6 @@ pipelines, and re-synthesizes results as objective facts with emotional overlays
 """
 
 import numpy as np
-import networkx as nx
 from scipy.spatial.distance import squareform
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import AgglomerativeClustering
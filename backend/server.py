@@ -1,4 +1,4 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -9,9 +9,9 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 import uuid
 from datetime import datetime
-from truth_detector import analyze_truth_claims, Claim, TruthDetectorCore
+from truth_detector import analyze_truth_claims, results_to_bytes, Claim, TruthDetectorCore
 from dual_pipeline_detector import analyze_claims_dual_pipeline, DualPipelineDetector
-from url_extractor import extract_content_from_url
+from url_extractor import extract_content_from_url, extract_content_from_urls
 import asyncio
 import json
 
@@ -230,10 +230,11 @@ async def analyze_urls_dual_pipeline(batch: URLBatch):
         extracted_claims = []
         extraction_errors = []
         
-        for i, url_input in enumerate(batch.urls):
+        # Download all URLs concurrently; results come back in request order
+        content_results = await extract_content_from_urls([url_input.url for url_input in batch.urls])
+        
+        for i, (url_input, content_result) in enumerate(zip(batch.urls, content_results)):
             try:
-                content_result = extract_content_from_url(url_input.url)
-                
                 if content_result["success"]:
                     # Create claim from extracted content
                     claim_text = f"{content_result['title']}\n\n{content_result['content']}"
@@ -416,11 +417,14 @@ async def run_truth_demo():
         # Analyze demo claims
         results = analyze_truth_claims(demo_claims)
         
-        return {
-            "message": "Truth detector demonstration completed",
-            "demo_claims_count": len(demo_claims),
-            "results": results
-        }
+        return Response(
+            content=results_to_bytes({
+                "message": "Truth detector demonstration completed",
+                "demo_claims_count": len(demo_claims),
+                "results": results
+            }),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Error in truth demo: {str(e)}")
@@ -459,10 +463,11 @@ async def analyze_urls(batch: URLBatch):
         extracted_claims = []
         extraction_errors = []
         
-        for i, url_input in enumerate(batch.urls):
+        # Download all URLs concurrently; results come back in request order
+        content_results = await extract_content_from_urls([url_input.url for url_input in batch.urls])
+        
+        for i, (url_input, content_result) in enumerate(zip(batch.urls, content_results)):
             try:
-                content_result = extract_content_from_url(url_input.url)
-                
                 if content_result["success"]:
                     # Create claim from extracted content
                     claim_text = f"{content_result['title']}\n\n{content_result['content']}"
@@ -1,14 +1,28 @@
 import numpy as np
-import networkx as nx
-from scipy.spatial.distance import squareform
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import AgglomerativeClustering
-from sklearn.metrics.pairwise import cosine_similarity
-from scipy.signal import coherence
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+from scipy.signal import get_window
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from typing import List, Dict, Tuple, Optional
 import logging
+import os
+import re
 import warnings
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
 
 # Suppress sklearn warnings for cleaner output
 warnings.filterwarnings('ignore')
@@ -17,9 +31,110 @@ warnings.filterwarnings('ignore')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if HAVE_NUMBA:
+    # Not parallel=True: clusters already run concurrently on a thread pool, and
+    # numba's default workqueue threading layer is not safe to enter from
+    # several threads at once
+    @njit(cache=True, fastmath=True)
+    def _pairwise_max_coh(F, P):
+        """Mean over row pairs of the peak magnitude-squared coherence"""
+        K, n_segments, n_freqs = F.shape
+        row_sums = np.zeros(K)
+        for i in range(K):
+            acc = 0.0
+            for j in range(i + 1, K):
+                best = 0.0
+                for f in range(n_freqs):
+                    denom = P[i, f] * P[j, f]
+                    if denom > 0.0:
+                        real = 0.0
+                        imag = 0.0
+                        for s in range(n_segments):
+                            a = F[i, s, f]
+                            b = F[j, s, f]
+                            real += a.real * b.real + a.imag * b.imag
+                            imag += a.real * b.imag - a.imag * b.real
+                        real /= n_segments
+                        imag /= n_segments
+                        c = (real * real + imag * imag) / denom
+                        if c > best:
+                            best = c
+                acc += best
+            row_sums[i] = acc
+        return row_sums.sum() / (K * (K - 1) / 2)
+
+    @njit(cache=True, fastmath=True)
+    def _first_cluster_sim(x, centroids, threshold):
+        """First centroid whose dot product with x exceeds threshold"""
+        for k in range(centroids.shape[0]):
+            s = 0.0
+            for d in range(x.shape[0]):
+                s += x[d] * centroids[k, d]
+            if s > threshold:
+                return k, s
+        return -1, 0.0
+
+# Token pattern shared by the vectorizers and the per-claim term sets
+TOKEN_PATTERN = r'\b[A-Za-z]{2,}\b'
+_TOKEN_RE = re.compile(TOKEN_PATTERN)
+
+# Shared by every detector for the per-cluster passes; its threads start on first use
+_CLUSTER_WORKERS = os.cpu_count() or 1
+_CLUSTER_EXECUTOR = ThreadPoolExecutor(max_workers=_CLUSTER_WORKERS)
+
+def _unit_rows(X: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving all-zero rows at zero"""
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return X / norms
+
+# Source type pairs that take opposing sides on the same topic
+OPPOSING_SOURCES = (
+    ('science', 'conspiracy'),
+    ('medical', 'anti-vaccine'),
+    ('expert', 'conspiracy'),
+    ('government', 'conspiracy'),
+    ('academic', 'conspiracy'),
+    ('history', 'conspiracy')
+)
+
+# One bit per source type that appears in an opposing pair; OPPOSING_MASKS[code]
+# holds the bits of every source type opposed to it
+SOURCE_CODES = {source: code for code, source in enumerate(
+    dict.fromkeys(source for pair in OPPOSING_SOURCES for source in pair)
+)}
+OPPOSING_MASKS = [0] * len(SOURCE_CODES)
+for _source1, _source2 in OPPOSING_SOURCES:
+    OPPOSING_MASKS[SOURCE_CODES[_source1]] |= 1 << SOURCE_CODES[_source2]
+    OPPOSING_MASKS[SOURCE_CODES[_source2]] |= 1 << SOURCE_CODES[_source1]
+
+def _merge_terms(terms: Optional[set], claim: 'Claim') -> Optional[set]:
+    """Union a claim's term set into a cluster's; None means the terms are unknown"""
+    if terms is None or claim.tokens is None:
+        return None
+    terms |= claim.tokens
+    return terms
+
+def _may_overlap(tokens: Optional[frozenset], terms: Optional[set]) -> bool:
+    """False only when a claim provably shares no vectorizer term with a cluster"""
+    return tokens is None or terms is None or not tokens.isdisjoint(terms)
+
+def _has_opposing_sources(source_mask: int) -> bool:
+    """Whether a bitmask of present source types contains an opposing pair"""
+    remaining = source_mask
+    while remaining:
+        bit = remaining & -remaining
+        if source_mask & OPPOSING_MASKS[bit.bit_length() - 1]:
+            return True
+        remaining ^= bit
+    return False
+
 # Enhanced Core Data Structures
 class Claim:
     """Enhanced claim structure with better validation"""
+    __slots__ = ('text', 'doc_id', 'source_type', 'index', 'cluster_id',
+                 'divergence_score', 'confidence_score', 'tokens')
+    
     def __init__(self, text: str, doc_id: int, source_type: str = "unknown"):
         if not text or not text.strip():
             raise ValueError("Claim text cannot be empty")
@@ -33,12 +148,16 @@ class Claim:
         self.cluster_id = None
         self.divergence_score = 0.0
         self.confidence_score = 0.0
+        # Vectorizer terms of the preprocessed text, set by embed_claims
+        self.tokens = None
 
     def __repr__(self):
         return f"Claim(text='{self.text[:50]}...', doc_id={self.doc_id}, source='{self.source_type}')"
 
 class Variant:
     """Enhanced variant with better support calculation"""
+    __slots__ = ('value_desc', 'claims', 'support', 'coherence_mass', 'confidence')
+    
     def __init__(self, value_desc: str, claims: List[Claim], support: float = 0.0):
         self.value_desc = value_desc
         self.claims = claims or []
@@ -61,7 +180,7 @@ class Variant:
         source_diversity_bonus = 0.3 * len(source_types)
         
         # Penalty for very short texts
-        avg_text_length = np.mean([len(claim.text) for claim in self.claims])
+        avg_text_length = sum(len(claim.text) for claim in self.claims) / len(self.claims)
         length_factor = min(1.0, avg_text_length / 50.0)  # Normalize to 50 chars
         
         self.support = base_support * (1 + source_diversity_bonus) * length_factor
@@ -69,6 +188,10 @@ class Variant:
 
 class Cluster:
     """Enhanced cluster with better validation and metrics"""
+    __slots__ = ('id', 'members', 'support', 'is_contradiction', 'variants', 'truth_variant',
+                 'higgs_mass', 'heat_center', 'coherence_score', 'doc_ids', 'source_types',
+                 'source_mask')
+    
     def __init__(self, cluster_id: int, members: List[Claim]):
         self.id = cluster_id
         self.members = members or []
@@ -79,6 +202,19 @@ class Cluster:
         self.higgs_mass = 0.0
         self.heat_center = None
         self.coherence_score = 0.0
+        self.doc_ids = frozenset()
+        self.source_types = frozenset()
+        self.source_mask = 0
+
+    def finalize(self) -> None:
+        """Cache member-derived document and source sets once membership is final"""
+        self.doc_ids = frozenset(c.doc_id for c in self.members)
+        self.source_types = frozenset(c.source_type for c in self.members)
+        self.source_mask = 0
+        for source_type in self.source_types:
+            code = SOURCE_CODES.get(source_type)
+            if code is not None:
+                self.source_mask |= 1 << code
 
     def validate(self) -> bool:
         """Validate cluster integrity"""
@@ -88,76 +224,157 @@ class Cluster:
             logger.warning(f"Cluster {self.id} has members with mismatched cluster IDs")
         return True
 
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Cut text to limit characters plus an ellipsis, slicing only when it is too long"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def _format_variant(variant: Dict) -> str:
+    """Format one variant entry for the inconsistency summary line"""
+    return f"Support {variant['support']}: '{variant['description']}'"
+
+
 class TruthDetectorCore:
     """Core truth detection engine with improved algorithms"""
     
+    # Below this many claims, fitting a TF-IDF vocabulary costs more than it adds
+    HASHING_MAX_CLAIMS = 32
+    # Below this many clustered claims, handing clusters to the thread pool costs more
+    # than it saves
+    PARALLEL_MIN_CLAIMS = 64
+    
     def __init__(self, min_cluster_size: int = 1, distance_threshold: float = 0.7):
         self.min_cluster_size = min_cluster_size
         self.distance_threshold = distance_threshold  # Increased for better clustering
         self.vectorizer = None
         self.embeddings = None
+        self._sim = None
+        self._sim_source = None
+        self._vectorizer_fitted = False
+        self._vocabulary_pinned = False
+        self._hashing_vectorizer = HashingVectorizer(
+            n_features=2 ** 12,
+            stop_words='english',
+            lowercase=False,  # Texts are lowercased in _preprocess_text
+            ngram_range=(1, 2),
+            token_pattern=TOKEN_PATTERN,
+            norm='l2',
+            alternate_sign=False,
+            dtype=np.float32
+        )
+    
+    def _preprocess_text(self, text: str, source_type: str = "unknown") -> str:
+        """Lowercase claim text and append its source type context"""
+        # Stopwords ("the", "is", "are", ...) are dropped by the vectorizer's
+        # stop_words='english' filter during tokenization
+        text = text.strip().lower()
+        # Add source type context but make it less dominant
+        return f"{text} [{source_type}]" if source_type != "unknown" else text
+    
+    def _build_vectorizer(self, num_claims: int) -> TfidfVectorizer:
+        """TF-IDF vectorizer with parameters adapted to dataset size"""
+        if num_claims <= 3:
+            # Very small dataset - use minimal parameters
+            max_features = min(100, num_claims * 20)
+            max_df = 1.0
+            min_df = 1
+        elif num_claims <= 10:
+            # Small dataset
+            max_features = min(500, num_claims * 30)
+            max_df = 0.9
+            min_df = 1
+        else:
+            # Larger dataset
+            max_features = 1000
+            max_df = 0.8
+            min_df = 1
+        
+        return TfidfVectorizer(
+            max_features=max_features,
+            min_df=min_df,
+            max_df=max_df,
+            stop_words='english',
+            lowercase=False,  # Texts are lowercased in _preprocess_text
+            ngram_range=(1, 2),  # Reduced for small datasets
+            token_pattern=TOKEN_PATTERN,
+            dtype=np.float32  # Similarity thresholds don't need double precision
+        )
+    
+    def fit_vocabulary(self, corpus: List[str]) -> None:
+        """
+        Fit and pin the TF-IDF vocabulary on a reference corpus
+        
+        Subsequent embed_claims/transform_claims calls only transform, which
+        suits streaming analysis where the vocabulary is stable across batches.
+        """
+        texts = [self._preprocess_text(text) for text in corpus if text and text.strip()]
+        if not texts:
+            raise ValueError("Corpus must contain at least one non-empty text")
+        
+        self.vectorizer = self._build_vectorizer(len(texts))
+        self.vectorizer.fit(texts)
+        self._vectorizer_fitted = True
+        self._vocabulary_pinned = True
+        logger.info(f"Fitted TF-IDF vocabulary with {len(self.vectorizer.vocabulary_)} terms")
+    
+    def transform_claims(self, claims: List[Claim]) -> np.ndarray:
+        """Embed claims with the already fitted vectorizer"""
+        if not self._vectorizer_fitted:
+            raise RuntimeError("Vectorizer is not fitted; call fit_vocabulary() or embed_claims() first")
+        
+        enhanced_texts = [self._preprocess_text(claim.text, claim.source_type) for claim in claims]
+        embeddings = self.vectorizer.transform(enhanced_texts).toarray()
+        for i, (claim, text) in enumerate(zip(claims, enhanced_texts)):
+            claim.index = i
+            claim.tokens = frozenset(_TOKEN_RE.findall(text))
+        self.embeddings = embeddings
+        return embeddings
         
     def embed_claims(self, claims: List[Claim]) -> np.ndarray:
-        """Enhanced embedding with better preprocessing and error handling"""
+        """Enhanced embedding with better preprocessing and error handling; rows are L2-normalized"""
         if not claims:
             logger.warning("No claims provided for embedding")
             return np.array([])
         
         try:
-            # Enhanced text preprocessing - focus on semantic content
-            enhanced_texts = []
-            for claim in claims:
-                # Clean and normalize text
-                text = claim.text.lower().strip()
-                # Remove some noise words that might interfere with similarity
-                text = text.replace("the ", "").replace("is ", "").replace("are ", "")
-                # Add source type context but make it less dominant
-                if claim.source_type != "unknown":
-                    text = f"{text} [{claim.source_type}]"
-                enhanced_texts.append(text)
-            
             # Handle single claim case
             if len(claims) == 1:
                 logger.info("Single claim provided - creating simple embedding")
                 # Create a simple embedding for single claims
-                self.embeddings = np.array([[1.0] * 10])  # Simple 10-dimensional vector
+                self.embeddings = _unit_rows(np.array([[1.0] * 10]))  # Simple 10-dimensional unit vector
                 claims[0].index = 0
+                claims[0].tokens = None
                 return self.embeddings
             
-            # Adjust TF-IDF parameters based on dataset size
-            num_claims = len(claims)
-            
-            if num_claims <= 3:
-                # Very small dataset - use minimal parameters
-                max_features = min(100, num_claims * 20)
-                max_df = 1.0
-                min_df = 1
-            elif num_claims <= 10:
-                # Small dataset
-                max_features = min(500, num_claims * 30)
-                max_df = 0.9
-                min_df = 1
+            if self._vocabulary_pinned:
+                embeddings = self.transform_claims(claims)
+                logger.info(f"Embedded {len(claims)} claims with pinned vocabulary into {embeddings.shape[1]} dimensions")
+                return embeddings
+            
+            # Enhanced text preprocessing - focus on semantic content
+            enhanced_texts = [self._preprocess_text(claim.text, claim.source_type) for claim in claims]
+            
+            if len(claims) < self.HASHING_MAX_CLAIMS:
+                # Stateless hashed term counts: no vocabulary or IDF fit for tiny batches
+                embeddings = self._hashing_vectorizer.transform(enhanced_texts).toarray()
+                # Keep only the buckets in use. Cosine similarity is unchanged, but MSC
+                # windows run across neighbouring columns, and in the sparse hashed
+                # space nearly every window would be empty
+                used = embeddings.any(axis=0)
+                if not used.any():
+                    # Same outcome as an empty TF-IDF vocabulary: use the fallback below
+                    raise ValueError("empty vocabulary; claims contain only stop words")
+                embeddings = embeddings[:, used]
             else:
-                # Larger dataset
-                max_features = 1000
-                max_df = 0.8
-                min_df = 1
-            
-            # Initialize TF-IDF with adaptive parameters
-            self.vectorizer = TfidfVectorizer(
-                max_features=max_features,
-                min_df=min_df,
-                max_df=max_df,
-                stop_words='english',
-                ngram_range=(1, 2),  # Reduced for small datasets
-                token_pattern=r'\b[A-Za-z]{2,}\b'
-            )
-            
-            embeddings = self.vectorizer.fit_transform(enhanced_texts).toarray()
-            
-            # Assign indices to claims
-            for i, claim in enumerate(claims):
+                # Initialize TF-IDF with adaptive parameters
+                self.vectorizer = self._build_vectorizer(len(claims))
+                embeddings = self.vectorizer.fit_transform(enhanced_texts).toarray()
+                self._vectorizer_fitted = True
+            
+            # Assign indices and term sets to claims
+            for i, (claim, text) in enumerate(zip(claims, enhanced_texts)):
                 claim.index = i
+                claim.tokens = frozenset(_TOKEN_RE.findall(text))
                 
             self.embeddings = embeddings
             logger.info(f"Successfully embedded {len(claims)} claims into {embeddings.shape[1]} dimensions")
@@ -167,9 +384,10 @@ class TruthDetectorCore:
             logger.error(f"Error in embedding claims: {str(e)}")
             # Fallback: create simple embeddings
             logger.info("Using fallback embedding method")
-            fallback_embeddings = np.random.rand(len(claims), 10)
+            fallback_embeddings = _unit_rows(np.random.rand(len(claims), 10))
             for i, claim in enumerate(claims):
                 claim.index = i
+                claim.tokens = None
             self.embeddings = fallback_embeddings
             return fallback_embeddings
 
@@ -179,11 +397,14 @@ class TruthDetectorCore:
             return []
         
         try:
-            # Calculate similarity matrix
-            similarity_matrix = cosine_similarity(embeddings)
+            # Calculate similarity matrix (cached for detect_contradictions)
+            similarity_matrix = self._similarity(embeddings)
             
             # Manual semantic clustering based on keywords and similarity
             clusters = []
+            # Union of member term sets per cluster. Claims sharing no term with a
+            # cluster have zero TF-IDF similarity to it, so those pairs are skipped
+            cluster_terms = []
             assigned_claims = set()
             
             # Define semantic groups based on keywords
@@ -213,60 +434,72 @@ class TruthDetectorCore:
                 # If we have multiple claims in this group, create a cluster
                 if len(group_claims) >= 2:
                     cluster = Cluster(len(clusters), group_claims)
-                    for j, claim in enumerate(group_claims):
+                    terms = set()
+                    for claim in group_claims:
                         claim.cluster_id = cluster.id
+                        terms = _merge_terms(terms, claim)
                     clusters.append(cluster)
+                    cluster_terms.append(terms)
                     logger.info(f"Created semantic cluster {cluster.id} for {group_name} with {len(group_claims)} claims")
                 elif len(group_claims) == 1:
                     # Single claim, check if it's similar to any existing cluster
                     added_to_cluster = False
                     claim = group_claims[0]
-                    claim_embedding = embeddings[claim.index]
                     
-                    for existing_cluster in clusters:
+                    for k, existing_cluster in enumerate(clusters):
+                        if not _may_overlap(claim.tokens, cluster_terms[k]):
+                            continue
                         # Calculate average similarity to existing cluster
-                        cluster_embeddings = [embeddings[c.index] for c in existing_cluster.members]
-                        if cluster_embeddings:
-                            avg_similarity = np.mean([cosine_similarity([claim_embedding], [c_emb])[0][0] for c_emb in cluster_embeddings])
-                            if avg_similarity > 0.3:  # Similarity threshold
-                                existing_cluster.members.append(claim)
-                                claim.cluster_id = existing_cluster.id
-                                added_to_cluster = True
-                                logger.info(f"Added claim to existing cluster {existing_cluster.id} with similarity {avg_similarity:.3f}")
-                                break
-                    
+                        member_indices = [c.index for c in existing_cluster.members]
+                        avg_similarity = similarity_matrix[claim.index, member_indices].mean()
+                        if avg_similarity > 0.3:  # Similarity threshold
+                            existing_cluster.members.append(claim)
+                            claim.cluster_id = existing_cluster.id
+                            cluster_terms[k] = _merge_terms(cluster_terms[k], claim)
+                            added_to_cluster = True
+                            logger.info(f"Added claim to existing cluster {existing_cluster.id} with similarity {avg_similarity:.3f}")
+                            break
+
                     if not added_to_cluster:
                         # Create single-claim cluster
                         cluster = Cluster(len(clusters), [claim])
                         claim.cluster_id = cluster.id
                         clusters.append(cluster)
+                        cluster_terms.append(_merge_terms(set(), claim))
             
             # Handle remaining unassigned claims
             for i, claim in enumerate(claims):
                 if i not in assigned_claims:
                     # Check similarity to existing clusters
                     added_to_cluster = False
-                    claim_embedding = embeddings[i]
                     
-                    for existing_cluster in clusters:
-                        if len(existing_cluster.members) > 0:
-                            # Calculate similarity to cluster centroid
-                            cluster_embeddings = [embeddings[c.index] for c in existing_cluster.members]
-                            cluster_centroid = np.mean(cluster_embeddings, axis=0)
-                            similarity = cosine_similarity([claim_embedding], [cluster_centroid])[0][0]
-                            
-                            if similarity > 0.4:  # Higher threshold for general similarity
-                                existing_cluster.members.append(claim)
-                                claim.cluster_id = existing_cluster.id
-                                added_to_cluster = True
-                                logger.info(f"Added unassigned claim to cluster {existing_cluster.id} with similarity {similarity:.3f}")
-                                break
+                    # Only clusters sharing a term can pass the threshold; keeping them in
+                    # order preserves first-match assignment
+                    candidates = [k for k, terms in enumerate(cluster_terms)
+                                  if _may_overlap(claim.tokens, terms)]
+                    if candidates:
+                        # Calculate similarity to cluster centroids
+                        centroids = _unit_rows(np.array([
+                            embeddings[[c.index for c in clusters[k].members]].mean(axis=0)
+                            for k in candidates
+                        ])).astype(embeddings.dtype, copy=False)
+                        best, similarity = self._first_similar_cluster(embeddings[i], centroids, 0.4)
+                        
+                        if best >= 0:  # Higher threshold for general similarity
+                            best = candidates[best]
+                            existing_cluster = clusters[best]
+                            existing_cluster.members.append(claim)
+                            claim.cluster_id = existing_cluster.id
+                            cluster_terms[best] = _merge_terms(cluster_terms[best], claim)
+                            added_to_cluster = True
+                            logger.info(f"Added unassigned claim to cluster {existing_cluster.id} with similarity {similarity:.3f}")
                     
                     if not added_to_cluster:
                         # Create new single-claim cluster
                         cluster = Cluster(len(clusters), [claim])
                         claim.cluster_id = cluster.id
                         clusters.append(cluster)
+                        cluster_terms.append(_merge_terms(set(), claim))
             
             # Log final clustering results
             multi_claim_clusters = [c for c in clusters if len(c.members) > 1]
@@ -279,20 +512,54 @@ class TruthDetectorCore:
             # Fallback to simple clustering
             return self._fallback_clustering(embeddings, claims)
     
+    def _first_similar_cluster(self, unit_embedding: np.ndarray, centroids: np.ndarray,
+                               threshold: float) -> Tuple[int, float]:
+        """Index and similarity of the first centroid above threshold, or (-1, 0.0)"""
+        if HAVE_NUMBA:
+            index, similarity = _first_cluster_sim(unit_embedding, centroids, threshold)
+            return int(index), float(similarity)
+        
+        similarities = centroids @ unit_embedding
+        hits = np.flatnonzero(similarities > threshold)
+        if hits.size == 0:
+            return -1, 0.0
+        return int(hits[0]), float(similarities[hits[0]])
+
+    def _similarity(self, embeddings: np.ndarray) -> np.ndarray:
+        """Cosine similarity matrix of the embeddings, computed once per analysis"""
+        if self._sim is None or self._sim_source is not embeddings:
+            # embed_claims returns unit-norm rows (or all-zero rows for texts with no
+            # terms), so cosine similarity is a plain dot product
+            if __debug__:
+                norms = np.linalg.norm(embeddings, axis=1)
+                assert np.allclose(norms[norms > 0], 1.0, atol=1e-3), "Embeddings must be L2-normalized"
+            self._sim = embeddings @ embeddings.T
+            self._sim_source = embeddings
+        return self._sim
+
+    def _threshold_components(self, similarity: np.ndarray, distance_threshold: float) -> np.ndarray:
+        """Label rows by connected components of the cosine distance < threshold graph"""
+        adjacency = csr_matrix((1.0 - similarity) < distance_threshold)
+        _, labels = connected_components(adjacency, directed=False)
+        return labels
+
+    def _tiny_cluster_labels(self, similarity: np.ndarray, distance_threshold: float) -> List[int]:
+        """Same labelling as _threshold_components, by direct comparison for <= 3 rows"""
+        labels = list(range(len(similarity)))
+        for i in range(len(labels)):
+            for j in range(i + 1, len(labels)):
+                if 1.0 - similarity[i, j] < distance_threshold and labels[j] != labels[i]:
+                    merged = labels[j]
+                    labels = [labels[i] if label == merged else label for label in labels]
+        return labels
+
     def _fallback_clustering(self, embeddings: np.ndarray, claims: List[Claim]) -> List[Cluster]:
         """Fallback clustering method"""
         try:
-            clustering = AgglomerativeClustering(
-                n_clusters=None,
-                metric='cosine',
-                linkage='average',
-                distance_threshold=0.7
-            )
-            
-            labels = clustering.fit_predict(embeddings)
+            labels = self._threshold_components(self._similarity(embeddings), distance_threshold=0.7)
             
             cluster_dict = {}
-            for i, label in enumerate(labels):
+            for i, label in enumerate(labels.tolist()):
                 if label not in cluster_dict:
                     cluster_dict[label] = Cluster(label, [])
                 cluster_dict[label].members.append(claims[i])
@@ -310,31 +577,53 @@ class TruthDetectorCore:
                 clusters.append(cluster)
             return clusters
 
+    def _map_clusters(self, fn, clusters: List[Cluster], embeddings: np.ndarray) -> None:
+        """Run fn(cluster, embeddings) for every cluster, on the shared thread pool for large batches"""
+        # Per-cluster work only mutates its own cluster, and the NumPy/FFT kernels
+        # release the GIL, so clusters can be processed concurrently
+        if (len(clusters) <= 1 or _CLUSTER_WORKERS <= 1
+                or sum(len(cluster.members) for cluster in clusters) < self.PARALLEL_MIN_CLAIMS):
+            for cluster in clusters:
+                fn(cluster, embeddings)
+            return
+        list(_CLUSTER_EXECUTOR.map(lambda cluster: fn(cluster, embeddings), clusters))
+
+    def _segment_spectra(self, rows: np.ndarray, nperseg: int) -> np.ndarray:
+        """Welch segment FFTs per row (Hann window, 50% overlap, constant detrend)"""
+        step = nperseg - nperseg // 2
+        n_segments = (rows.shape[1] - nperseg) // step + 1
+        starts = np.arange(n_segments) * step
+        segments = rows[:, starts[:, None] + np.arange(nperseg)]
+        segments = segments - segments.mean(axis=-1, keepdims=True)
+        return np.fft.rfft(segments * get_window('hann', nperseg), axis=-1)
+
     def compute_msc_coherence(self, cluster_emb: np.ndarray) -> float:
         """Improved MSC coherence calculation with better error handling"""
         if len(cluster_emb) < 2:
             return 1.0
         
         try:
-            msc_values = []
-            min_len = max(2, min(len(row) for row in cluster_emb))
-            
-            for i in range(len(cluster_emb)):
-                for j in range(i + 1, len(cluster_emb)):
-                    try:
-                        # Ensure minimum length for coherence calculation
-                        x = cluster_emb[i][:min_len]
-                        y = cluster_emb[j][:min_len]
-                        
-                        if len(x) >= 2 and len(y) >= 2:
-                            _, Cxy = coherence(x, y, fs=1.0, nperseg=min(8, min_len))
-                            if len(Cxy) > 0:
-                                msc_values.append(np.max(Cxy))
-                    except Exception as e:
-                        logger.debug(f"Error calculating coherence for pair {i},{j}: {str(e)}")
-                        continue
+            # Spectral estimates stay in float64 even for float32 embeddings
+            cluster_emb = np.asarray(cluster_emb, dtype=np.float64)
+            min_len = cluster_emb.shape[1]
+            if min_len < 4:
+                return 1.0
+            
+            # One FFT pass per row; every pair's cross-spectrum is built from these
+            F = self._segment_spectra(cluster_emb, min(8, min_len))
+            P = (np.abs(F) ** 2).mean(axis=1)
+            if HAVE_NUMBA:
+                return float(_pairwise_max_coh(F, P))
+            
+            # Upper-triangle pairs only, as aligned (pairs, segments, freqs) arrays
+            i, j = np.triu_indices(len(cluster_emb), k=1)
+            Sxy = (F[i].conj() * F[j]).mean(axis=1)
             
-            return np.mean(msc_values) if msc_values else 1.0
+            denom = P[i] * P[j]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                Cxy = np.where(denom > 0, np.abs(Sxy) ** 2 / denom, 0.0)
+            
+            return float(Cxy.max(axis=-1).mean())
             
         except Exception as e:
             logger.warning(f"Error in MSC coherence calculation: {str(e)}")
@@ -342,57 +631,99 @@ class TruthDetectorCore:
 
     def detect_contradictions(self, clusters: List[Cluster], embeddings: np.ndarray) -> None:
         """Enhanced contradiction detection with better variant analysis"""
+        # Membership is final from here on
         for cluster in clusters:
-            if len(cluster.members) <= 1:
-                continue
+            cluster.finalize()
+        
+        # Build the shared similarity matrix before fanning out to worker threads
+        self._similarity(embeddings)
+        self._map_clusters(self._detect_cluster_contradiction, clusters, embeddings)
+
+    def _detect_cluster_contradiction(self, cluster: Cluster, embeddings: np.ndarray) -> None:
+        """Contradiction detection for a single cluster"""
+        if len(cluster.members) <= 1:
+            return
+            
+        try:
+            cluster_indices = [claim.index for claim in cluster.members if claim.index is not None]
+            if not cluster_indices:
+                return
+            
+            # Check for source diversity as a contradiction indicator
+            sources = cluster.source_types
+            
+            # If we have multiple sources in the same cluster, it's likely a contradiction
+            if len(sources) > 1:
+                # Look for opposing source types
+                has_opposing_sources = _has_opposing_sources(cluster.source_mask)
                 
-            try:
-                cluster_indices = [claim.index for claim in cluster.members if claim.index is not None]
-                if not cluster_indices:
-                    continue
+                if has_opposing_sources or len(sources) >= 3:
+                    # This is likely a contradiction - create variants by source type
+                    cluster.is_contradiction = True
+                    variants = {}
                     
-                cluster_emb = embeddings[cluster_indices]
+                    for claim in cluster.members:
+                        source_key = claim.source_type
+                        if source_key not in variants:
+                            variants[source_key] = {
+                                'claims': [],
+                                'value_desc': claim.text,
+                                'source_diversity': set()
+                            }
+                        variants[source_key]['claims'].append(claim)
+                        variants[source_key]['source_diversity'].add(claim.source_type)
+                    
+                    # Create variants
+                    cluster.variants = []
+                    for source_key, variant_data in variants.items():
+                        variant = Variant(
+                            variant_data['value_desc'],
+                            variant_data['claims']
+                        )
+                        variant.calculate_support()
+                        cluster.variants.append(variant)
+                    
+                    # Find truth variant (highest support)
+                    if cluster.variants:
+                        cluster.truth_variant = max(cluster.variants, key=lambda x: x.support)
+                        
+                    logger.info(f"Cluster {cluster.id} detected as contradiction with {len(cluster.variants)} variants from sources: {sources}")
+                    return
+            
+            # Alternative: Sub-clustering approach for more subtle contradictions
+            if len(cluster.members) > 2:
+                # More strict threshold for sub-clustering
+                cluster_sim = self._similarity(embeddings)[np.ix_(cluster_indices, cluster_indices)]
+                if len(cluster_indices) <= 3:
+                    sub_labels = self._tiny_cluster_labels(cluster_sim, distance_threshold=0.4)
+                else:
+                    sub_labels = self._threshold_components(cluster_sim, distance_threshold=0.4)
                 
-                # Check for source diversity as a contradiction indicator
-                sources = set(claim.source_type for claim in cluster.members)
+                # Group variants by sub-clusters
+                variants = {}
+                for i, label in enumerate(sub_labels):
+                    claim = cluster.members[i]
+                    if label not in variants:
+                        variants[label] = {
+                            'claims': [],
+                            'value_desc': claim.text,
+                            'source_diversity': set()
+                        }
+                    variants[label]['claims'].append(claim)
+                    variants[label]['source_diversity'].add(claim.source_type)
                 
-                # If we have multiple sources in the same cluster, it's likely a contradiction
-                if len(sources) > 1:
-                    # Look for opposing source types
-                    opposing_sources = [
-                        ('science', 'conspiracy'),
-                        ('medical', 'anti-vaccine'),
-                        ('expert', 'conspiracy'),
-                        ('government', 'conspiracy'),
-                        ('academic', 'conspiracy'),
-                        ('history', 'conspiracy')
-                    ]
+                # Check if we have meaningful variants
+                if len(variants) > 1:
+                    # Check if variants have different source types or significant text differences
+                    # Some pair differs exactly when not every variant matches the first
+                    source_ids = np.array([hash(frozenset(v['source_diversity'])) for v in variants.values()])
+                    has_different_sources = bool((source_ids != source_ids[0]).any())
                     
-                    has_opposing_sources = False
-                    for source1, source2 in opposing_sources:
-                        if source1 in sources and source2 in sources:
-                            has_opposing_sources = True
-                            break
-                    
-                    if has_opposing_sources or len(sources) >= 3:
-                        # This is likely a contradiction - create variants by source type
+                    if has_different_sources or len(variants) >= 3:
                         cluster.is_contradiction = True
-                        variants = {}
-                        
-                        for claim in cluster.members:
-                            source_key = claim.source_type
-                            if source_key not in variants:
-                                variants[source_key] = {
-                                    'claims': [],
-                                    'value_desc': claim.text,
-                                    'source_diversity': set()
-                                }
-                            variants[source_key]['claims'].append(claim)
-                            variants[source_key]['source_diversity'].add(claim.source_type)
-                        
-                        # Create variants
                         cluster.variants = []
-                        for source_key, variant_data in variants.items():
+                        
+                        for variant_data in variants.values():
                             variant = Variant(
                                 variant_data['value_desc'],
                                 variant_data['claims']
@@ -400,104 +731,53 @@ class TruthDetectorCore:
                             variant.calculate_support()
                             cluster.variants.append(variant)
                         
-                        # Find truth variant (highest support)
+                        # Find truth variant
                         if cluster.variants:
                             cluster.truth_variant = max(cluster.variants, key=lambda x: x.support)
                             
-                        logger.info(f"Cluster {cluster.id} detected as contradiction with {len(cluster.variants)} variants from sources: {sources}")
-                        continue
+                        logger.info(f"Cluster {cluster.id} detected as subtle contradiction with {len(cluster.variants)} variants")
                 
-                # Alternative: Sub-clustering approach for more subtle contradictions
-                if len(cluster.members) > 2:
-                    sub_clustering = AgglomerativeClustering(
-                        n_clusters=None,
-                        metric='cosine',
-                        linkage='average',
-                        distance_threshold=0.4  # More strict for sub-clustering
-                    )
-                    
-                    sub_labels = sub_clustering.fit_predict(cluster_emb)
-                    
-                    # Group variants by sub-clusters
-                    variants = {}
-                    for i, label in enumerate(sub_labels):
-                        claim = cluster.members[i]
-                        if label not in variants:
-                            variants[label] = {
-                                'claims': [],
-                                'value_desc': claim.text,
-                                'source_diversity': set()
-                            }
-                        variants[label]['claims'].append(claim)
-                        variants[label]['source_diversity'].add(claim.source_type)
-                    
-                    # Check if we have meaningful variants
-                    if len(variants) > 1:
-                        # Check if variants have different source types or significant text differences
-                        variant_sources = [list(v['source_diversity']) for v in variants.values()]
-                        has_different_sources = any(s1 != s2 for i, s1 in enumerate(variant_sources) for s2 in variant_sources[i+1:])
-                        
-                        if has_different_sources or len(variants) >= 3:
-                            cluster.is_contradiction = True
-                            cluster.variants = []
-                            
-                            for variant_data in variants.values():
-                                variant = Variant(
-                                    variant_data['value_desc'],
-                                    variant_data['claims']
-                                )
-                                variant.calculate_support()
-                                cluster.variants.append(variant)
-                            
-                            # Find truth variant
-                            if cluster.variants:
-                                cluster.truth_variant = max(cluster.variants, key=lambda x: x.support)
-                                
-                            logger.info(f"Cluster {cluster.id} detected as subtle contradiction with {len(cluster.variants)} variants")
-                    
-            except Exception as e:
-                logger.warning(f"Error detecting contradictions in cluster {cluster.id}: {str(e)}")
-                continue
+        except Exception as e:
+            logger.warning(f"Error detecting contradictions in cluster {cluster.id}: {str(e)}")
 
     def assign_coherence_scores(self, clusters: List[Cluster], embeddings: np.ndarray) -> None:
         """Enhanced coherence scoring with better metrics"""
-        for cluster in clusters:
-            try:
-                cluster_indices = [claim.index for claim in cluster.members if claim.index is not None]
-                if not cluster_indices:
-                    continue
-                    
-                # Calculate FT coherence
-                ft_coherence = self.compute_msc_coherence(embeddings[cluster_indices])
+        self._map_clusters(self._score_cluster_coherence, clusters, embeddings)
+
+    def _score_cluster_coherence(self, cluster: Cluster, embeddings: np.ndarray) -> None:
+        """Coherence scoring for a single cluster"""
+        try:
+            cluster_indices = [claim.index for claim in cluster.members if claim.index is not None]
+            if not cluster_indices:
+                return
                 
-                if not cluster.is_contradiction:
-                    # Simple cluster support calculation
-                    doc_ids = set(c.doc_id for c in cluster.members)
-                    source_types = set(c.source_type for c in cluster.members)
-                    
-                    base_support = len(doc_ids)
-                    diversity_bonus = 0.3 * len(source_types)
-                    
-                    cluster.support = base_support * (1 + diversity_bonus) * ft_coherence
-                    cluster.coherence_score = ft_coherence
-                    
-                else:
-                    # Update variant supports with coherence
-                    for variant in cluster.variants:
-                        var_indices = [c.index for c in variant.claims if c.index is not None]
-                        if var_indices:
-                            var_coherence = self.compute_msc_coherence(embeddings[var_indices])
-                            variant.support *= var_coherence
-                            variant.coherence_mass = var_coherence
+            # Calculate FT coherence
+            ft_coherence = self.compute_msc_coherence(embeddings[cluster_indices])
+            
+            if not cluster.is_contradiction:
+                # Simple cluster support calculation
+                base_support = len(cluster.doc_ids)
+                diversity_bonus = 0.3 * len(cluster.source_types)
+                
+                cluster.support = base_support * (1 + diversity_bonus) * ft_coherence
+                cluster.coherence_score = ft_coherence
+                
+            else:
+                # Update variant supports with coherence
+                for variant in cluster.variants:
+                    var_indices = [c.index for c in variant.claims if c.index is not None]
+                    if var_indices:
+                        var_coherence = self.compute_msc_coherence(embeddings[var_indices])
+                        variant.support *= var_coherence
+                        variant.coherence_mass = var_coherence
+                
+                # Update truth variant
+                if cluster.variants:
+                    cluster.truth_variant = max(cluster.variants, key=lambda x: x.support)
+                    cluster.coherence_score = cluster.truth_variant.coherence_mass
                     
-                    # Update truth variant
-                    if cluster.variants:
-                        cluster.truth_variant = max(cluster.variants, key=lambda x: x.support)
-                        cluster.coherence_score = cluster.truth_variant.coherence_mass
-                        
-            except Exception as e:
-                logger.warning(f"Error assigning coherence scores to cluster {cluster.id}: {str(e)}")
-                continue
+        except Exception as e:
+            logger.warning(f"Error assigning coherence scores to cluster {cluster.id}: {str(e)}")
 
     def analyze_claims(self, claims: List[Claim]) -> Dict:
         """Main analysis pipeline with comprehensive error handling"""
@@ -574,7 +854,7 @@ class TruthDetectorCore:
                     variants_info = []
                     for variant in cluster.variants:
                         variants_info.append({
-                            'description': variant.value_desc[:100] + ("..." if len(variant.value_desc) > 100 else ""),
+                            'description': _truncate(variant.value_desc),
                             'support': float(variant.support),
                             'claim_count': len(variant.claims)
                         })
@@ -582,7 +862,7 @@ class TruthDetectorCore:
                     inconsistencies.append({
                         'cluster_id': int(cluster.id),
                         'variants': variants_info,
-                        'truth_variant': cluster.truth_variant.value_desc[:100] + ("..." if len(cluster.truth_variant.value_desc) > 100 else "") if cluster.truth_variant else None
+                        'truth_variant': _truncate(cluster.truth_variant.value_desc) if cluster.truth_variant else None
                     })
                     
                 elif cluster.support > 1.0:  # High support threshold
@@ -591,8 +871,8 @@ class TruthDetectorCore:
                         'claim': cluster.members[0].text,
                         'support': float(cluster.support),
                         'coherence': float(cluster.coherence_score),
-                        'sources': len(set(c.source_type for c in cluster.members)),
-                        'document_count': len(set(c.doc_id for c in cluster.members))
+                        'sources': len(cluster.source_types),
+                        'document_count': len(cluster.doc_ids)
                     })
             
             # Generate narrative
@@ -652,77 +932,86 @@ class TruthDetectorCore:
     def generate_enhanced_summary(self, clusters: List[Cluster], probable_truths: List[Dict], 
                                  inconsistencies: List[Dict], total_claims: int) -> str:
         """Generate enhanced summary with detailed analysis"""
-        summary_parts = []
-        
-        summary_parts.append("=== TRUTH DETECTION ANALYSIS SUMMARY ===\n")
-        
-        # Overview
-        summary_parts.append(f"**ANALYSIS OVERVIEW:**")
-        summary_parts.append(f"- Total Claims Processed: {total_claims}")
-        summary_parts.append(f"- Clusters Formed: {len(clusters)}")
-        summary_parts.append(f"- High-Confidence Truths: {len(probable_truths)}")
-        summary_parts.append(f"- Contradictions Detected: {len(inconsistencies)}")
-        summary_parts.append("")
-        
-        # Probable truths
-        if probable_truths:
-            summary_parts.append("**PROBABLE TRUTHS (High Coherence):**")
-            for truth in probable_truths[:10]:  # Top 10
-                summary_parts.append(f"- {truth['claim']}")
-                summary_parts.append(f"  └─ Support: {truth['support']}, Sources: {truth['sources']}, Coherence: {truth['coherence']}")
-            summary_parts.append("")
-        
-        # Inconsistencies
-        if inconsistencies:
-            summary_parts.append("**DETECTED INCONSISTENCIES:**")
-            for inconsistency in inconsistencies:
-                variants_desc = [f"Support {v['support']}: '{v['description']}'" for v in inconsistency['variants']]
-                summary_parts.append(f"- Disputed: {' vs '.join(variants_desc)}")
-            summary_parts.append("")
-        
-        # Recommendations
-        summary_parts.append("**RECOMMENDATIONS:**")
-        if len(probable_truths) < 3:
-            summary_parts.append("- Consider adding more diverse source claims for better analysis")
-        if len(inconsistencies) > len(probable_truths):
-            summary_parts.append("- High inconsistency detected - verify source reliability")
-        if total_claims < 10:
-            summary_parts.append("- Analysis confidence would improve with more claims")
+        def lines():
+            yield "=== TRUTH DETECTION ANALYSIS SUMMARY ===\n"
+            
+            # Overview
+            yield "**ANALYSIS OVERVIEW:**"
+            yield f"- Total Claims Processed: {total_claims}"
+            yield f"- Clusters Formed: {len(clusters)}"
+            yield f"- High-Confidence Truths: {len(probable_truths)}"
+            yield f"- Contradictions Detected: {len(inconsistencies)}"
+            yield ""
+            
+            # Probable truths
+            if probable_truths:
+                yield "**PROBABLE TRUTHS (High Coherence):**"
+                for truth in probable_truths[:10]:  # Top 10
+                    yield f"- {truth['claim']}"
+                    yield f"  └─ Support: {truth['support']}, Sources: {truth['sources']}, Coherence: {truth['coherence']}"
+                yield ""
+            
+            # Inconsistencies
+            if inconsistencies:
+                yield "**DETECTED INCONSISTENCIES:**"
+                for inconsistency in inconsistencies:
+                    yield f"- Disputed: {' vs '.join(map(_format_variant, inconsistency['variants']))}"
+                yield ""
+            
+            # Recommendations
+            yield "**RECOMMENDATIONS:**"
+            if len(probable_truths) < 3:
+                yield "- Consider adding more diverse source claims for better analysis"
+            if len(inconsistencies) > len(probable_truths):
+                yield "- High inconsistency detected - verify source reliability"
+            if total_claims < 10:
+                yield "- Analysis confidence would improve with more claims"
         
-        return "\n".join(summary_parts)
+        # Lines are produced lazily and joined once, with no intermediate parts list
+        return "\n".join(lines())
 
     def serialize_clusters(self, clusters: List[Cluster]) -> List[Dict]:
         """Serialize clusters for JSON response"""
-        serialized = []
-        for cluster in clusters:
-            cluster_data = {
-                'id': int(cluster.id),
+        # Ids, supports and coherence scores are already Python int/float/bool
+        # (compute_msc_coherence returns float), so no per-field coercion is needed
+        return [
+            {
+                'id': cluster.id,
                 'member_count': len(cluster.members),
-                'support': float(cluster.support),
-                'coherence_score': float(cluster.coherence_score),
-                'is_contradiction': bool(cluster.is_contradiction),
-                'claims': [claim.text for claim in cluster.members[:5]]  # First 5 claims
-            }
-            
-            if cluster.is_contradiction and cluster.variants:
-                cluster_data['variants'] = [
+                'support': cluster.support,
+                'coherence_score': cluster.coherence_score,
+                'is_contradiction': cluster.is_contradiction,
+                'claims': [claim.text for claim in islice(cluster.members, 5)],  # First 5 claims
+                **({'variants': [
                     {
-                        'description': variant.value_desc[:100] + ("..." if len(variant.value_desc) > 100 else ""),
-                        'support': float(variant.support),
+                        'description': _truncate(variant.value_desc),
+                        'support': variant.support,
                         'claim_count': len(variant.claims)
                     }
                     for variant in cluster.variants
-                ]
-            
-            serialized.append(cluster_data)
-        
-        return serialized
+                ]} if cluster.is_contradiction and cluster.variants else {})
+            }
+            for cluster in clusters
+        ]
+
+    def to_json_bytes(self, clusters: List[Cluster]) -> bytes:
+        """Serialize clusters straight to JSON bytes (orjson when installed)"""
+        return results_to_bytes(self.serialize_clusters(clusters))
 
 # Factory function for easy instantiation
 def create_truth_detector(min_cluster_size: int = 1, distance_threshold: float = 0.5) -> TruthDetectorCore:
     """Create a configured truth detector instance"""
     return TruthDetectorCore(min_cluster_size, distance_threshold)
 
+def results_to_bytes(results: Dict) -> bytes:
+    """Serialize analysis results to JSON bytes, accepting NumPy scalars and arrays"""
+    if HAVE_ORJSON:
+        return orjson.dumps(results, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        results,
+        default=lambda obj: obj.tolist() if hasattr(obj, 'tolist') else str(obj)
+    ).encode('utf-8')
+
 # Convenience function for quick analysis
 def analyze_truth_claims(claims_data: List[Dict]) -> Dict:
     """
@@ -735,17 +1024,17 @@ def analyze_truth_claims(claims_data: List[Dict]) -> Dict:
         Dictionary with analysis results
     """
     try:
-        # Convert to Claim objects
-        claims = []
-        for i, claim_data in enumerate(claims_data):
-            claim = Claim(
-                text=claim_data.get('text', ''),
-                doc_id=claim_data.get('doc_id', i),
-                source_type=claim_data.get('source_type', 'unknown')
-            )
-            claims.append(claim)
+        # Convert to Claim objects in one pass with the constructor bound locally
+        make_claim = Claim
+        claims = [
+            make_claim(claim_data.get('text', ''),
+                       claim_data.get('doc_id', i),
+                       claim_data.get('source_type', 'unknown'))
+            for i, claim_data in enumerate(claims_data)
+        ]
         
-        # Analyze
+        # Analyze with a fresh detector: detectors keep per-call state, so they are not
+        # shared between concurrent requests
         detector = create_truth_detector()
         results = detector.analyze_claims(claims)
         
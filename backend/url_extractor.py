@@ -1,60 +1,543 @@
-import requests
+import asyncio
+import hashlib
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+import httpx
+import httpcore
 import newspaper
 from newspaper import Article
 from bs4 import BeautifulSoup
 from readability import Document
 import html2text
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import re
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlencode, parse_qsl
 import time
 
 logger = logging.getLogger(__name__)
 
+try:
+    from selectolax.parser import HTMLParser
+    HAVE_SELECTOLAX = True
+except ImportError:
+    HAVE_SELECTOLAX = False
+
+try:
+    import trafilatura
+    HAVE_TRAFILATURA = True
+except ImportError:
+    HAVE_TRAFILATURA = False
+
+try:
+    import hyperscan
+    HAVE_HYPERSCAN = True
+except ImportError:
+    HAVE_HYPERSCAN = False
+
+class ArticleCache:
+    """Thread-safe in-process LRU cache of extraction results with per-entry expiry"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 86400):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key_for(url: str) -> str:
+        """Content address for a URL, ignoring utm_* tracking params and fragments"""
+        parsed = urlparse(url.strip())
+        query = urlencode([(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+                           if not k.lower().startswith('utm_')])
+        normalized = parsed._replace(query=query, fragment='').geturl()
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        key = self.key_for(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(result)
+    
+    def set(self, url: str, result: Dict[str, str]):
+        key = self.key_for(url)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, dict(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+class DNSCache:
+    """TTL cache of resolved addresses, used by the extractor's HTTP transports only"""
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, host: str, port: int) -> Optional[Tuple[str, ...]]:
+        """Cached addresses for host and port, or None if absent or expired"""
+        key = (host, port)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, addresses = entry
+            if expires_at >= time.monotonic():
+                self._entries.move_to_end(key)
+                return addresses
+            del self._entries[key]
+            return None
+    
+    def resolve(self, host: str, port: int) -> Tuple[str, ...]:
+        """IP addresses for host and port in resolver order, cached for ttl seconds"""
+        addresses = self.get(host, port)
+        if addresses is not None:
+            return addresses
+        
+        # Resolve outside the lock; failures propagate and are not cached
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+        addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[(host, port)] = (time.monotonic() + self.ttl, addresses)
+            self._entries.move_to_end((host, port))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return addresses
+
+dns_cache = DNSCache()
+
+class _CachedDNSBackend(httpcore.NetworkBackend):
+    """Network backend that connects to cached addresses instead of resolving every time"""
+    
+    def __init__(self, backend: httpcore.NetworkBackend, cache: DNSCache):
+        self._backend = backend
+        self._cache = cache
+    
+    def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        # TLS still verifies and sends SNI for the original hostname, which the pool passes separately
+        error = None
+        for address in self._cache.resolve(host, port):
+            try:
+                return self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        raise error or httpcore.ConnectError(f"No addresses for {host}")
+    
+    def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return self._backend.connect_unix_socket(path, timeout, socket_options)
+    
+    def sleep(self, seconds):
+        self._backend.sleep(seconds)
+
+class _AsyncCachedDNSBackend(httpcore.AsyncNetworkBackend):
+    """Async counterpart of _CachedDNSBackend; lookups on a cache miss run in a worker thread"""
+    
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, cache: DNSCache):
+        self._backend = backend
+        self._cache = cache
+    
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        addresses = self._cache.get(host, port)
+        if addresses is None:
+            addresses = await asyncio.to_thread(self._cache.resolve, host, port)
+        error = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        raise error or httpcore.ConnectError(f"No addresses for {host}")
+    
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+    
+    async def sleep(self, seconds):
+        await self._backend.sleep(seconds)
+
+# httpcore errors raised by the pools below and their httpx counterparts, most specific first
+_HTTPCORE_ERRORS = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+@contextmanager
+def _httpx_errors():
+    """Re-raise httpcore errors as the httpx errors callers already handle"""
+    try:
+        yield
+    except Exception as e:
+        for core_error, httpx_error in _HTTPCORE_ERRORS:
+            if isinstance(e, core_error):
+                raise httpx_error(str(e)) from e
+        raise
+
+def _core_request(request: httpx.Request) -> httpcore.Request:
+    """The httpcore request for an httpx request"""
+    return httpcore.Request(
+        method=request.method,
+        url=httpcore.URL(
+            scheme=request.url.raw_scheme,
+            host=request.url.raw_host,
+            port=request.url.port,
+            target=request.url.raw_path
+        ),
+        headers=request.headers.raw,
+        content=request.stream,
+        extensions=request.extensions
+    )
+
+class _ResponseStream(httpx.SyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def __iter__(self):
+        with _httpx_errors():
+            yield from self._stream
+    
+    def close(self):
+        if hasattr(self._stream, 'close'):
+            self._stream.close()
+
+class _AsyncResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+    
+    async def __aiter__(self):
+        with _httpx_errors():
+            async for part in self._stream:
+                yield part
+    
+    async def aclose(self):
+        if hasattr(self._stream, 'aclose'):
+            await self._stream.aclose()
+
+class _CachedDNSTransport(httpx.BaseTransport):
+    """Pooled transport whose connections resolve hosts through dns_cache"""
+    
+    def __init__(self, http2: bool = False, limits: httpx.Limits = httpx.Limits()):
+        self._pool = httpcore.ConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http2=http2,
+            network_backend=_CachedDNSBackend(httpcore.SyncBackend(), dns_cache)
+        )
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with _httpx_errors():
+            response = self._pool.handle_request(_core_request(request))
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions
+        )
+    
+    def close(self):
+        self._pool.close()
+
+class _AsyncCachedDNSTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of _CachedDNSTransport"""
+    
+    def __init__(self, http2: bool = False, limits: httpx.Limits = httpx.Limits()):
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http2=http2,
+            network_backend=_AsyncCachedDNSBackend(httpcore.AnyIOBackend(), dns_cache)
+        )
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(_core_request(request))
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_AsyncResponseStream(response.stream),
+            extensions=response.extensions
+        )
+    
+    async def aclose(self):
+        await self._pool.aclose()
+
+
 class URLContentExtractor:
     """Robust URL content extraction with multiple fallback methods"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+    NOISE_TAGS = ["script", "style", "nav", "header", "footer", "aside"]
+    CONTENT_SELECTORS = [
+        'article', '[role="main"]', '.article-content', '.post-content',
+        '.entry-content', '.content', 'main', '.article-body'
+    ]
+    # Page bodies are read up to this many bytes; the rest is never downloaded
+    MAX_CONTENT_BYTES = 2_000_000
+    # Common noise patterns, matched case-insensitively
+    NOISE_PATTERNS = [
+        r'Cookie.*?Accept',
+        r'Subscribe.*?Newsletter',
+        r'Follow us on.*?Twitter',
+        r'Share.*?Facebook',
+        r'Advertisement',
+        r'Loading\.\.\.'
+    ]
+    
+    def __init__(self, max_concurrency: int = 32):
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
         self.timeout = 10
+        # Shared pooled HTTP/2 client for the synchronous extraction paths
+        # Its transport skips repeat DNS lookups for domains fetched within the last few minutes
+        self.session = httpx.Client(
+            transport=_CachedDNSTransport(http2=True, limits=httpx.Limits(max_keepalive_connections=32)),
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True
+        )
+        self.max_concurrency = max_concurrency
+        self._async_client = None
+        self._parse_executor = None
+        self.cache = ArticleCache()
+        self._ws_re = re.compile(r'\s+')
+        # http(s) scheme followed by a host; group 1 is the source domain
+        self._url_re = re.compile(r'^https?://([^/\s?#]+)', re.IGNORECASE)
+        self._noise_re = re.compile('|'.join(self.NOISE_PATTERNS), re.IGNORECASE)
+        self._noise_db = self._compile_noise_db() if HAVE_HYPERSCAN else None
+        self._hs_local = threading.local()
+    
+    def _compile_noise_db(self):
+        """Compile the noise patterns into one Hyperscan database, or None on failure"""
+        try:
+            count = len(self.NOISE_PATTERNS)
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[pattern.encode('utf-8') for pattern in self.NOISE_PATTERNS],
+                ids=list(range(count)),
+                elements=count,
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * count
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Hyperscan noise database unavailable, using re only: {str(e)}")
+            return None
+    
+    def _has_noise(self, text: str) -> bool:
+        """Whether any noise pattern occurs in text, in one Hyperscan pass"""
+        # Scratch space is per thread since pages are parsed concurrently
+        scratch = getattr(self._hs_local, 'scratch', None)
+        if scratch is None:
+            scratch = self._hs_local.scratch = hyperscan.Scratch(self._noise_db)
+        found = []
+        try:
+            self._noise_db.scan(
+                text.encode('utf-8'),
+                match_event_handler=lambda *match: found.append(True),
+                scratch=scratch
+            )
+        except Exception as e:
+            logger.warning(f"Hyperscan scan failed: {str(e)}")
+            return True
+        return bool(found)
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled HTTP/2 client shared by batch extraction"""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                transport=_AsyncCachedDNSTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+                ),
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+        return self._async_client
+    
+    def _get_parse_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool that parses downloaded pages"""
+        if self._parse_executor is None:
+            # The C-backed parsers release the GIL, so one worker per core keeps
+            # parsing of fetched pages running alongside the remaining downloads
+            self._parse_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4,
+                thread_name_prefix="url-parse"
+            )
+        return self._parse_executor
+    
+    async def aclose(self):
+        """Close the async client; it is recreated on next use"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    async def _fetch(self, url: str, semaphore: asyncio.Semaphore) -> bytes:
+        """Download a URL body through the shared async client"""
+        async with semaphore:
+            async with self._get_async_client().stream('GET', url) as response:
+                response.raise_for_status()
+                body = bytearray()
+                async for chunk in response.aiter_bytes(65536):
+                    body += chunk
+                    if len(body) >= self.MAX_CONTENT_BYTES:
+                        break
+                return bytes(body[:self.MAX_CONTENT_BYTES])
+    
+    async def _extract_one(self, url: str, semaphore: asyncio.Semaphore) -> Dict[str, str]:
+        """Fetch one URL asynchronously and parse it on a worker thread"""
+        source_domain = self._source_domain(url)
+        if source_domain is None:
+            return {
+                "title": "",
+                "content": "",
+                "source_domain": "",
+                "success": False,
+                "error": "Invalid URL format"
+            }
+        
+        cached = self.cache.get(url)
+        if cached is not None:
+            return cached
+        
+        try:
+            html = await self._fetch(url, semaphore)
+        except Exception as e:
+            logger.warning(f"Async fetch failed for {url}: {str(e)}")
+            return {
+                "title": "",
+                "content": "",
+                "source_domain": source_domain,
+                "success": False,
+                "error": f"Extraction failed: {str(e)}"
+            }
+        
+        # HTML parsing is synchronous; run it off the event loop so it overlaps with downloads
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._get_parse_executor(), self._extract_from_html, url, html)
+        result["source_domain"] = source_domain
+        if result["success"]:
+            self.cache.set(url, result)
+        return result
+    
+    async def extract_many(self, urls: List[str]) -> List[Dict[str, str]]:
+        """
+        Extract article content from many URLs concurrently
+        Returns results in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(*[self._extract_one(url, semaphore) for url in urls])
+    
+    def extract_many_sync(self, urls: List[str]) -> List[Dict[str, str]]:
+        """Blocking wrapper around extract_many for callers without an event loop"""
+        async def run():
+            try:
+                return await self.extract_many(urls)
+            finally:
+                # The client is bound to this event loop, which asyncio.run closes
+                await self.aclose()
+        return asyncio.run(run())
+    
+    def _fetch_html(self, url: str) -> bytes:
+        """Download a page body through the shared session, capped at MAX_CONTENT_BYTES"""
+        with self.session.stream('GET', url) as response:
+            response.raise_for_status()
+            body = bytearray()
+            for chunk in response.iter_bytes(65536):
+                body += chunk
+                if len(body) >= self.MAX_CONTENT_BYTES:
+                    break
+            return bytes(body[:self.MAX_CONTENT_BYTES])
+    
+    def _extract_from_fetched_html(self, url: str) -> Dict[str, str]:
+        """Download the page once and run every extraction method on it"""
+        try:
+            html = self._fetch_html(url)
+        except Exception as e:
+            logger.warning(f"Fetching {url} failed: {str(e)}")
+            return {
+                "title": "",
+                "content": "",
+                "success": False,
+                "error": str(e)
+            }
+        
+        return self._extract_from_html(url, html)
+    
+    def _extract_from_html(self, url: str, html: bytes) -> Dict[str, str]:
+        """Run the extraction methods in order on an already downloaded page"""
+        result = self._extract_primary(url, html)
+        if result["success"]:
+            return result
+        
+        result = self._extract_with_readability(html)
+        if result["success"]:
+            return result
+        
+        return self._extract_with_beautifulsoup(html)
         
     def extract_article_content(self, url: str) -> Dict[str, str]:
         """
         Extract article content from URL using multiple methods
         Returns: {title, content, source_domain, success, error}
+        Successful extractions are served from the article cache on repeat requests.
         """
+        cached = self.cache.get(url)
+        if cached is not None:
+            return cached
+        
+        result = self._extract_article_content_uncached(url)
+        if result.get("success"):
+            self.cache.set(url, result)
+        return result
+    
+    def _extract_article_content_uncached(self, url: str) -> Dict[str, str]:
+        """Download the page once and keep the first successful extraction"""
+        # Validate URL
+        source_domain = self._source_domain(url)
+        if source_domain is None:
+            return {
+                "title": "",
+                "content": "",
+                "source_domain": "",
+                "success": False,
+                "error": "Invalid URL format"
+            }
+        
         try:
-            # Validate URL
-            if not self._is_valid_url(url):
-                return {
-                    "title": "",
-                    "content": "",
-                    "source_domain": "",
-                    "success": False,
-                    "error": "Invalid URL format"
-                }
-            
-            source_domain = urlparse(url).netloc
             logger.info(f"Extracting content from: {source_domain}")
             
-            # Method 1: newspaper3k (best for news articles)
-            result = self._extract_with_newspaper(url)
-            if result["success"]:
-                result["source_domain"] = source_domain
-                return result
-            
-            # Method 2: readability + BeautifulSoup
-            result = self._extract_with_readability(url)
-            if result["success"]:
-                result["source_domain"] = source_domain
-                return result
-                
-            # Method 3: Basic BeautifulSoup fallback
-            result = self._extract_with_beautifulsoup(url)
+            # Every method parses the same download, so the MAX_CONTENT_BYTES cap
+            # holds for newspaper3k too
+            result = self._extract_from_fetched_html(url)
             result["source_domain"] = source_domain
             return result
             
@@ -63,24 +546,60 @@ class URLContentExtractor:
             return {
                 "title": "",
                 "content": "",
-                "source_domain": urlparse(url).netloc if self._is_valid_url(url) else "",
+                "source_domain": source_domain,
                 "success": False,
                 "error": f"Extraction failed: {str(e)}"
             }
     
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format"""
+        return self._source_domain(url) is not None
+    
+    def _source_domain(self, url: str) -> Optional[str]:
+        """Host part of an http(s) URL, or None if the URL is not valid"""
+        match = self._url_re.match(url) if isinstance(url, str) else None
+        return match.group(1) if match else None
+    
+    def _extract_primary(self, url: str, html: bytes) -> Dict[str, str]:
+        """Run the primary extractor: trafilatura when installed, otherwise newspaper3k"""
+        if HAVE_TRAFILATURA:
+            return self._extract_with_trafilatura(url, html)
+        return self._extract_with_newspaper(url, html)
+    
+    def _extract_with_trafilatura(self, url: str, html: Optional[bytes] = None) -> Dict[str, str]:
+        """Extract using trafilatura, downloading the page through the session unless html is given"""
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except:
-            return False
+            if html is None:
+                html = self._fetch_html(url)
+            
+            content = trafilatura.extract(
+                html,
+                url=url,
+                output_format='txt',
+                favor_precision=True,
+                include_comments=False
+            )
+            
+            if content and len(content.strip()) > 100:
+                metadata = trafilatura.extract_metadata(html, default_url=url)
+                return {
+                    "title": (metadata.title if metadata is not None else None) or "Untitled Article",
+                    "content": content.strip(),
+                    "success": True,
+                    "error": None
+                }
+            else:
+                return {"success": False, "error": "Insufficient content extracted"}
+                
+        except Exception as e:
+            logger.warning(f"Trafilatura extraction failed: {str(e)}")
+            return {"success": False, "error": str(e)}
     
-    def _extract_with_newspaper(self, url: str) -> Dict[str, str]:
-        """Extract using newspaper3k library"""
+    def _extract_with_newspaper(self, url: str, html: bytes) -> Dict[str, str]:
+        """Extract using newspaper3k library from an already downloaded page"""
         try:
             article = Article(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
             
             if article.text and len(article.text.strip()) > 100:
@@ -97,30 +616,34 @@ class URLContentExtractor:
             logger.warning(f"Newspaper extraction failed: {str(e)}")
             return {"success": False, "error": str(e)}
     
-    def _extract_with_readability(self, url: str) -> Dict[str, str]:
-        """Extract using readability + BeautifulSoup"""
+    def _extract_with_readability(self, html: bytes) -> Dict[str, str]:
+        """Extract main content from page HTML using readability + BeautifulSoup"""
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
             # Use readability to extract main content
-            doc = Document(response.content)
+            doc = Document(html)
             readable_html = doc.summary()
             
             # Convert to plain text
-            soup = BeautifulSoup(readable_html, 'html.parser')
+            if HAVE_SELECTOLAX:
+                tree = HTMLParser(readable_html)
+                heading = tree.css_first('h1')
+                heading = heading.text() if heading is not None else None
+                content = tree.body.text() if tree.body is not None else tree.text()
+            else:
+                soup = BeautifulSoup(readable_html, 'lxml')
+                heading = soup.find('h1')
+                heading = heading.get_text() if heading else None
+                content = soup.get_text()
             
             # Extract title
-            title = doc.title() or soup.find('h1')
-            if title and hasattr(title, 'get_text'):
-                title = title.get_text().strip()
-            elif isinstance(title, str):
-                title = title.strip()
-            else:
-                title = "Untitled Article"
+            title = doc.title() or heading
+            title = title.strip() if title else "Untitled Article"
+            
+            # Cleaning only shrinks text, so a short raw body can never pass the check
+            if len(content) <= 100:
+                return {"success": False, "error": "Insufficient content after readability extraction"}
             
             # Extract content
-            content = soup.get_text()
             content = self._clean_text(content)
             
             if len(content.strip()) > 100:
@@ -137,44 +660,86 @@ class URLContentExtractor:
             logger.warning(f"Readability extraction failed: {str(e)}")
             return {"success": False, "error": str(e)}
     
-    def _extract_with_beautifulsoup(self, url: str) -> Dict[str, str]:
-        """Fallback extraction using BeautifulSoup"""
+    def _select_with_selectolax(self, html: bytes) -> Tuple[str, str]:
+        """Title and main-content text using the C-backed selectolax parser"""
+        tree = HTMLParser(html)
+        
+        # Remove script and style elements
+        tree.strip_tags(self.NOISE_TAGS)
+        
+        # Try to find title
+        title = tree.css_first('title')
+        if title is None:
+            title = tree.css_first('h1')
+        title = title.text().strip() if title is not None else "Untitled Article"
+        
+        # Try to find main content area
+        content = ""
+        for selector in self.CONTENT_SELECTORS:
+            element = tree.css_first(selector)
+            if element is not None:
+                content = element.text()
+                break
+        
+        # Fallback to body if no specific content found
+        if not content and tree.body is not None:
+            content = tree.body.text()
+        
+        return title, content
+    
+    def _select_with_beautifulsoup(self, html: bytes) -> Tuple[str, str]:
+        """Title and main-content text using BeautifulSoup on the lxml parser"""
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # Remove script and style elements
+        for script in soup(self.NOISE_TAGS):
+            script.decompose()
+        
+        # Try to find title
+        title = soup.find('title')
+        if title:
+            title = title.get_text().strip()
+        else:
+            title = soup.find('h1')
+            title = title.get_text().strip() if title else "Untitled Article"
+        
+        # Try to find main content area
+        content = ""
+        for selector in self.CONTENT_SELECTORS:
+            elements = soup.select(selector)
+            if elements:
+                content = elements[0].get_text()
+                break
+        
+        # Fallback to body if no specific content found
+        if not content:
+            body = soup.find('body')
+            if body:
+                content = body.get_text()
+        
+        return title, content
+    
+    def _extract_with_beautifulsoup(self, html: bytes) -> Dict[str, str]:
+        """Fallback extraction from page HTML using selectolax, or BeautifulSoup if that fails"""
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                script.decompose()
-            
-            # Try to find title
-            title = soup.find('title')
-            if title:
-                title = title.get_text().strip()
-            else:
-                title = soup.find('h1')
-                title = title.get_text().strip() if title else "Untitled Article"
-            
-            # Try to find main content area
-            content_selectors = [
-                'article', '[role="main"]', '.article-content', '.post-content',
-                '.entry-content', '.content', 'main', '.article-body'
-            ]
+            selected = None
+            if HAVE_SELECTOLAX:
+                try:
+                    selected = self._select_with_selectolax(html)
+                except Exception as e:
+                    logger.warning(f"selectolax parsing failed, falling back to BeautifulSoup: {str(e)}")
+            if selected is None:
+                selected = self._select_with_beautifulsoup(html)
+            title, content = selected
             
-            content = ""
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    content = elements[0].get_text()
-                    break
-            
-            # Fallback to body if no specific content found
-            if not content:
-                body = soup.find('body')
-                if body:
-                    content = body.get_text()
+            # Cleaning only shrinks text, so a short raw body can never pass the check
+            if len(content) <= 100:
+                return {
+                    "title": title,
+                    "content": content.strip(),
+                    "success": False,
+                    "error": "Insufficient content extracted with BeautifulSoup"
+                }
             
             content = self._clean_text(content)
             
@@ -207,30 +772,28 @@ class URLContentExtractor:
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove common noise patterns
-        noise_patterns = [
-            r'Cookie.*?Accept',
-            r'Subscribe.*?Newsletter',
-            r'Follow us on.*?Twitter',
-            r'Share.*?Facebook',
-            r'Advertisement',
-            r'Loading\.\.\.',
-        ]
-        
-        for pattern in noise_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        # Collapse whitespace first so noise patterns can match across line breaks,
+        # then strip all noise patterns in one alternation pass
+        text = self._ws_re.sub(' ', text)
+        # Hyperscan reports every match rather than re's leftmost-lazy ones, so it
+        # only decides whether the substitution pass is needed at all
+        if self._noise_db is None or self._has_noise(text):
+            text = self._noise_re.sub('', text)
         
         # Clean up extra spaces
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return self._ws_re.sub(' ', text).strip()
 
 # Global extractor instance
 url_extractor = URLContentExtractor()
 
 def extract_content_from_url(url: str) -> Dict[str, str]:
     """Convenience function for URL content extraction"""
-    return url_extractor.extract_article_content(url)
\ No newline at end of file
+    return url_extractor.extract_article_content(url)
+
+async def extract_content_from_urls(urls: List[str]) -> List[Dict[str, str]]:
+    """Convenience function for concurrent extraction of many URLs"""
+    return await url_extractor.extract_many(urls)
+
+def extract_many_sync(urls: List[str]) -> List[Dict[str, str]]:
+    """Blocking convenience function for concurrent extraction of many URLs"""
+    return url_extractor.extract_many_sync(urls)
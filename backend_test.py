@@ -2,61 +2,537 @@
 """
 Comprehensive Backend Testing for Truth Detector API
 Tests all endpoints and core functionality
+
+Run as a script for the full concurrent suite, or under pytest
+(optionally sharded with pytest-xdist: pytest -n auto backend_test.py)
+
+Set CACHE_API=1 to serve repeated GETs from backend_test_cache.sqlite;
+pass --clear-cache or delete that file to fetch them fresh. With vcrpy
+installed, VCR_MODE=new_episodes records traffic under fixtures/cassettes
+and VCR_MODE=none replays it without touching the network
+
+Per-test output is shown with --verbose; --json appends all results
+as one JSON document
 """
 
-import requests
+import asyncio
+import httpx
+import os
+import socket
+import sqlite3
 import sys
+import time
 import json
+from collections import deque
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+
+    def json_dumps_pretty(obj: Any) -> bytes:
+        """Indented UTF-8 JSON bytes for reports"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON bytes, matching orjson's output format"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def json_dumps_pretty(obj: Any) -> bytes:
+        """Indented UTF-8 JSON bytes for reports"""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+try:
+    import msgspec
+    HAVE_MSGSPEC = True
+except ImportError:
+    HAVE_MSGSPEC = False
+
+try:
+    import vcr
+    HAVE_VCR = True
+except ImportError:
+    HAVE_VCR = False
+
+# (connect, read) timeouts: fail fast on dead endpoints, allow longer reads for heavy analyses
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=3.05)
+SLOW_TIMEOUT = httpx.Timeout(30.0, connect=3.05)
+# URL analysis depends on the backend reaching external sites and is allowed to fail
+URL_TIMEOUT = httpx.Timeout(5.0, connect=3.05)
+# Setting VCR_MODE (e.g. new_episodes, or none to replay only) records HTTP traffic to
+# cassettes and replays it on later runs; responses match on method, URL and body
+VCR_MODE = os.environ.get('VCR_MODE')
+RECORDER = None
+if VCR_MODE and HAVE_VCR:
+    RECORDER = vcr.VCR(cassette_library_dir='fixtures/cassettes', record_mode=VCR_MODE,
+                       match_on=['method', 'scheme', 'host', 'path', 'body'])
+
+# Wall-clock budget for a whole run; requests are cut short or skipped once it runs out
+SUITE_TIMEOUT_SEC = float(os.environ.get('SUITE_TIMEOUT_SEC', 120))
+
+# Required response fields and their JSON types
+HEALTH_FIELDS = {'status': str, 'timestamp': str, 'service': str}
+DEMO_FIELDS = {'message': str, 'demo_claims_count': int, 'results': dict}
+DEMO_RESULTS_FIELDS = {'total_claims': int, 'total_clusters': int, 'contradictions': int,
+                       'probable_truths': list, 'inconsistencies': list, 'narrative': str, 'summary': str}
+ANALYZE_FIELDS = {'id': str, 'timestamp': str, **DEMO_RESULTS_FIELDS, 'clusters': list}
+DUAL_RESULTS_FIELDS = {'total_claims': int, 'factual_claims': int, 'emotional_claims': int,
+                       'factual_loci': int, 'emotional_variants': int,
+                       'fair_witness_narrative': str, 'dual_pipeline_summary': str}
+DUAL_ANALYZE_FIELDS = {'id': str, 'timestamp': str, **DUAL_RESULTS_FIELDS, 'processing_details': dict}
+
+# Presence is checked with one set difference per response
+REQUIRED_HEALTH = frozenset(HEALTH_FIELDS)
+REQUIRED_DEMO = frozenset(DEMO_FIELDS)
+REQUIRED_DEMO_RESULTS = frozenset(DEMO_RESULTS_FIELDS)
+REQUIRED_ANALYZE = frozenset(ANALYZE_FIELDS)
+REQUIRED_DUAL_RESULTS = frozenset(DUAL_RESULTS_FIELDS)
+REQUIRED_DUAL_ANALYZE = frozenset(DUAL_ANALYZE_FIELDS)
+
+# With msgspec, field types are also validated in a single C-level pass
+RESPONSE_TYPES = {}
+if HAVE_MSGSPEC:
+    for _type_name, _fields in (('HealthResp', HEALTH_FIELDS), ('DemoResp', DEMO_FIELDS),
+                                ('DemoResultsResp', DEMO_RESULTS_FIELDS), ('AnalyzeResp', ANALYZE_FIELDS),
+                                ('DualResultsResp', DUAL_RESULTS_FIELDS), ('DualAnalyzeResp', DUAL_ANALYZE_FIELDS)):
+        RESPONSE_TYPES[frozenset(_fields)] = msgspec.defstruct(_type_name, list(_fields.items()))
+
+def missing_fields_of(required: frozenset, obj: Any) -> List[str]:
+    """Sorted required fields absent from a response object"""
+    if not isinstance(obj, dict):
+        return sorted(required)
+    return sorted(required - obj.keys())
+
+def structure_error(required: frozenset, obj: Any, label: str = "fields") -> Optional[str]:
+    """Why a response object fails its required shape, or None if it matches"""
+    missing = missing_fields_of(required, obj)
+    if missing:
+        return f"Missing {label}: {missing}"
+    response_type = RESPONSE_TYPES.get(required)
+    if response_type is not None:
+        try:
+            msgspec.convert(obj, response_type)
+        except msgspec.ValidationError as e:
+            return f"Invalid {label}: {e}"
+    return None
+
+# Request bodies are serialized once at import and posted as raw bytes
+CUSTOM_CLAIMS = json_dumps({
+    "claims": [
+        {"text": "The Earth is round", "source_type": "science"},
+        {"text": "The Earth is flat", "source_type": "conspiracy"},
+        {"text": "Water boils at 100°C", "source_type": "science"},
+        {"text": "Exercise is good for health", "source_type": "health"}
+    ]
+})
+
+CONTRADICTORY_CLAIMS = json_dumps({
+    "claims": [
+        {"text": "The sky is blue during the day", "source_type": "observation"},
+        {"text": "The sky is green during the day", "source_type": "false_claim"},
+        {"text": "Water freezes at 0°C", "source_type": "science"},
+        {"text": "Water freezes at 50°C", "source_type": "false_claim"},
+        {"text": "Humans need oxygen to breathe", "source_type": "biology"},
+        {"text": "Humans don't need oxygen to breathe", "source_type": "false_claim"}
+    ]
+})
+
+SIMILAR_CLAIMS = json_dumps({
+    "claims": [
+        {"text": "Exercise improves cardiovascular health", "source_type": "medical"},
+        {"text": "Physical activity is good for the heart", "source_type": "health"},
+        {"text": "Working out strengthens the cardiovascular system", "source_type": "fitness"},
+        {"text": "The Earth orbits around the Sun", "source_type": "astronomy"},
+        {"text": "Our planet revolves around the solar system's star", "source_type": "science"},
+        {"text": "Eating vegetables provides essential nutrients", "source_type": "nutrition"},
+        {"text": "Consuming plant foods gives important vitamins", "source_type": "dietary"}
+    ]
+})
+
+DIVERSE_SOURCES = json_dumps({
+    "claims": [
+        {"text": "Climate change is caused by human activities", "source_type": "science"},
+        {"text": "Climate change is caused by human activities", "source_type": "government"},
+        {"text": "Climate change is caused by human activities", "source_type": "academic"},
+        {"text": "Climate change is caused by human activities", "source_type": "expert"},
+        {"text": "Climate change is natural", "source_type": "opinion"}
+    ]
+})
+
+MIXED_CLAIMS = json_dumps({
+    "claims": [
+        # Factual claims
+        {"text": "The temperature was recorded at 25°C at 3:00 PM", "source_type": "weather_station"},
+        {"text": "According to the study, water boils at 100°C at sea level", "source_type": "science"},
+        {"text": "The building is located at 123 Main Street", "source_type": "official_record"},
+        
+        # Emotional claims
+        {"text": "I was absolutely terrified when I saw the accident", "source_type": "witness"},
+        {"text": "The whole situation seemed incredibly confusing to me", "source_type": "witness"},
+        {"text": "I think this is the most amazing discovery ever made", "source_type": "opinion"},
+        
+        # Mixed claims
+        {"text": "The terrifying collision occurred at 3:42 PM at Main Street", "source_type": "news"},
+        {"text": "Scientists are excited about this groundbreaking research", "source_type": "news"}
+    ]
+})
+
+FACTUAL_CLAIMS = json_dumps({
+    "claims": [
+        {"text": "The experiment was conducted at 20°C temperature", "source_type": "science"},
+        {"text": "Data shows that the reaction occurred at 15:30 hours", "source_type": "lab_report"},
+        {"text": "According to measurements, the distance is 150 meters", "source_type": "survey"},
+        {"text": "The building was constructed in 1995", "source_type": "official_record"}
+    ]
+})
+
+EMOTIONAL_CLAIMS = json_dumps({
+    "claims": [
+        {"text": "I feel absolutely devastated by this news", "source_type": "social_media"},
+        {"text": "This seems like the most confusing situation ever", "source_type": "opinion"},
+        {"text": "I think this is incredibly beautiful and amazing", "source_type": "review"},
+        {"text": "The whole experience was terrifyingly intense", "source_type": "personal_account"}
+    ]
+})
+
+# Stop words only, so neither vectorizer finds any terms
+STOPWORD_CLAIMS = json_dumps({
+    "claims": [
+        {"text": "It is", "source_type": "test"},
+        {"text": "They are", "source_type": "test"}
+    ]
+})
+
+# Single-kind batches: (claim kind, request body, the kind that must be absent)
+PURE_CASES = (
+    ('factual', FACTUAL_CLAIMS, 'emotional'),
+    ('emotional', EMOTIONAL_CLAIMS, 'factual')
+)
+
+# A simple URL; this may fail if the backend cannot reach external sites
+URL_BATCH = json_dumps({
+    "urls": [
+        {"url": "https://example.com", "source_type": "news"}
+    ]
+})
+
+SENTIMENT_TEST_CLAIMS = json_dumps({
+    "claims": [
+        # Clearly factual (should be classified as factual)
+        {"text": "The temperature measured 25 degrees Celsius", "source_type": "measurement"},
+        {"text": "According to the data, the event occurred at 3:00 PM", "source_type": "report"},
+        
+        # Clearly emotional (should be classified as emotional)
+        {"text": "I absolutely hate this terrible situation", "source_type": "opinion"},
+        {"text": "This is the most beautiful thing I have ever seen", "source_type": "review"},
+        
+        # Neutral factual (should be classified as factual)
+        {"text": "The building has 10 floors", "source_type": "architecture"},
+        
+        # Strong emotional (should be classified as emotional)
+        {"text": "I am devastated and completely heartbroken", "source_type": "personal"}
+    ]
+})
+
+# Endpoint paths under /api by key; {aid} is filled in with an analysis ID
+ENDPOINTS = {
+    'health': 'health',
+    'truth_demo': 'truth-demo',
+    'truth_analyze': 'truth-analyze',
+    'truth_analysis': 'truth-analyze/{aid}',
+    'dual_demo': 'dual-pipeline-demo',
+    'dual_analyze': 'dual-pipeline-analyze',
+    'dual_analysis': 'dual-pipeline-analyze/{aid}',
+    'dual_urls': 'analyze-urls-dual-pipeline'
+}
+
+class EndpointCheck:
+    """One API request plus the response fields it must return"""
+    __slots__ = ('name', 'method', 'endpoint', 'expected_status', 'body', 'timeout', 'aid',
+                 'structure_name', 'required', 'sub_path', 'sub_structure_name', 'sub_required')
+    
+    def __init__(self, name: str, method: str, endpoint: str, expected_status: int,
+                 body: Optional[bytes] = None, timeout: Optional[httpx.Timeout] = None,
+                 structure_name: str = "", required: frozenset = frozenset(),
+                 sub_path: str = "", sub_structure_name: str = "", sub_required: frozenset = frozenset(),
+                 aid: Optional[str] = None):
+        # Unknown endpoint keys fail at import rather than as a request error
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint key: {endpoint}")
+        self.name = name
+        self.method = method
+        self.endpoint = endpoint
+        self.expected_status = expected_status
+        self.body = body
+        self.timeout = timeout
+        self.structure_name = structure_name
+        self.required = required
+        self.sub_path = sub_path
+        self.sub_structure_name = sub_structure_name
+        self.sub_required = sub_required
+        self.aid = aid
+
+# Checks with no assertions beyond status and required fields; all independent
+ENDPOINT_CHECKS = [
+    # Basic endpoint tests
+    EndpointCheck("Health Check", "GET", "health", 200,
+                  structure_name="Health Response Structure", required=REQUIRED_HEALTH),
+    EndpointCheck("Truth Demo", "POST", "truth_demo", 200, timeout=SLOW_TIMEOUT,
+                  structure_name="Demo Response Structure", required=REQUIRED_DEMO,
+                  sub_path='results', sub_structure_name="Demo Results Structure",
+                  sub_required=REQUIRED_DEMO_RESULTS),
+    
+    # Truth analyze edge cases; validation errors expected except for a single claim
+    EndpointCheck("Truth Analyze - Empty Claims", "POST", "truth_analyze", 422,
+                  json_dumps({"claims": []})),
+    EndpointCheck("Truth Analyze - Invalid Structure", "POST", "truth_analyze", 422,
+                  json_dumps({"claims": [{"invalid_field": "test"}]})),
+    # One character over ClaimInput.text max_length (7000)
+    EndpointCheck("Truth Analyze - Long Claim", "POST", "truth_analyze", 422,
+                  json_dumps({"claims": [{"text": "x" * 7001, "source_type": "test"}]})),
+    EndpointCheck("Truth Analyze - Single Claim", "POST", "truth_analyze", 200,
+                  json_dumps({"claims": [{"text": "Single test claim", "source_type": "test"}]})),
+    
+    # Analysis retrieval tests
+    EndpointCheck("Get Non-existent Analysis", "GET", "truth_analysis", 404, aid="non-existent-id-12345"),
+    
+    # Dual pipeline edge cases
+    EndpointCheck("Dual Pipeline Empty Claims", "POST", "dual_analyze", 422,
+                  json_dumps({"claims": []})),
+    EndpointCheck("Dual Pipeline Single Claim", "POST", "dual_analyze", 200,
+                  json_dumps({"claims": [{"text": "Single test claim for dual pipeline", "source_type": "test"}]}))
+]
+
+# Tests whose passes are called out in the final report
+CRITICAL_TESTS = frozenset({'Health Check', 'Truth Demo', 'Truth Analyze - Valid Claims', 'Contradiction Detection'})
+
+# Checks whose responses get further assertions in their test methods
+TRUTH_ANALYZE_CHECK = EndpointCheck(
+    "Truth Analyze - Valid Claims", "POST", "truth_analyze", 200, CUSTOM_CLAIMS,
+    structure_name="Analyze Response Structure", required=REQUIRED_ANALYZE)
+DUAL_DEMO_CHECK = EndpointCheck(
+    "Dual Pipeline Demo", "POST", "dual_demo", 200, timeout=SLOW_TIMEOUT,
+    structure_name="Dual Pipeline Demo Structure", required=REQUIRED_DEMO,
+    sub_path='results', sub_structure_name="Dual Pipeline Results Structure",
+    sub_required=REQUIRED_DUAL_RESULTS)
+DUAL_MIXED_CHECK = EndpointCheck(
+    "Dual Pipeline Mixed Claims", "POST", "dual_analyze", 200, MIXED_CLAIMS,
+    structure_name="Mixed Claims Response Structure", required=REQUIRED_DUAL_ANALYZE)
+
+class ResponseCache:
+    """SQLite cache of GET responses for quick local reruns; delete the file to force a re-fetch"""
+    __slots__ = ('_conn', 'ttl')
+    
+    # Enabled by setting CACHE_API; POSTs are never cached since each creates a new analysis
+    PATH = 'backend_test_cache.sqlite'
+    TTL = 3600
+    
+    def __init__(self, path: str = PATH, ttl: float = TTL):
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses '
+            '(url TEXT PRIMARY KEY, stored REAL, status INTEGER, content_type TEXT, body BLOB)'
+        )
+    
+    def get(self, url: str) -> Optional[httpx.Response]:
+        """Cached response for a URL, or None if absent or expired"""
+        row = self._conn.execute(
+            'SELECT status, content_type, body FROM responses WHERE url = ? AND stored > ?',
+            (url, time.time() - self.ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        status, content_type, body = row
+        return httpx.Response(status, headers={'content-type': content_type}, content=body)
+    
+    def put(self, url: str, response: httpx.Response):
+        """Store a response; server errors are not cached"""
+        if response.status_code >= 500:
+            return
+        self._conn.execute(
+            'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+            (url, time.time(), response.status_code, response.headers.get('content-type', ''), response.content)
+        )
+        self._conn.commit()
+    
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
 
 class TruthDetectorAPITester:
-    def __init__(self, base_url: str = "https://c469af75-54a2-48bf-9ce0-2fab0541c0bb.preview.emergentagent.com"):
+    # Requests allowed in flight at once, so a large suite cannot flood the server
+    MAX_CONCURRENT_REQUESTS = 16
+    # Gateway errors from the hosted preview are retried; no test expects them
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    STATUS_RETRIES = 3
+    RETRY_BACKOFF = 0.3
+
+    # Used when neither a base URL argument nor TRUTH_API_URL is given
+    DEFAULT_BASE_URL = "https://c469af75-54a2-48bf-9ce0-2fab0541c0bb.preview.emergentagent.com"
+
+    def __init__(self, base_url: Optional[str] = None, verbose: bool = False, json_report: bool = False):
+        base_url = (base_url or os.environ.get('TRUTH_API_URL') or self.DEFAULT_BASE_URL).rstrip('/')
         self.base_url = base_url
+        # Per-test lines are only collected when verbose; the summary is always printed
+        self.verbose = verbose
+        self.json_report = json_report
         self.api_url = f"{base_url}/api"
+        # Full URL (or URL template) per endpoint key, built once
+        self._urls = {key: f"{self.api_url}/{path}" for key, path in ENDPOINTS.items()}
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = []
+        # Latest result per test name, and failures in the order they happened
+        self.test_results_by_name = {}
+        self.failed_tests = []
+        # Accepted failures of external dependencies; pytest reports these as skips
+        self.external_failures = []
+        # Bodies of the last few passing tests, kept only for debugging
+        self.recent_passed_responses = deque(maxlen=5)
+        # Pooled keep-alive client and request slots, opened for the duration of run_all_tests
+        self.client = None
+        self._request_slots = None
+        self.response_cache = None
+        self._deadline = None
+        # Analyses created once per run and shared by the tests that retrieve them
+        self._seeds = {}
+        # Cassette recording, entered while the client is open
+        self._recording = ExitStack()
+        # Test output lines, written to stdout in one go when the run finishes
+        self._out = []
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """One pooled async client shared by every concurrently running test"""
+        # Over HTTP/2 the concurrent tests multiplex as streams on one TLS connection;
+        # the connection limit only matters if the server falls back to HTTP/1.1.
+        # Retries cover connection failures; HTTP error statuses are test results.
+        # Small JSON bodies go out immediately (no Nagle delay) on kept-alive sockets
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=self.MAX_CONCURRENT_REQUESTS,
+                                max_keepalive_connections=self.MAX_CONCURRENT_REQUESTS),
+            retries=2,
+            socket_options=[
+                (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        )
+        return httpx.AsyncClient(
+            headers={'Content-Type': 'application/json'},
+            timeout=DEFAULT_TIMEOUT,
+            transport=transport
+        )
+
+    def _open(self, cassette: str = 'backend_test'):
+        """Open the pooled client and request slots on the running event loop"""
+        if RECORDER is not None:
+            self._recording.enter_context(RECORDER.use_cassette(f'{cassette}.yaml'))
+        self.client = self._create_client()
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._deadline = time.monotonic() + SUITE_TIMEOUT_SEC
+        self._seeds = {}
+        if os.environ.get('CACHE_API'):
+            self.response_cache = ResponseCache()
+
+    async def close(self):
+        """Close the pooled HTTP client and the response cache"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+        if self.response_cache is not None:
+            self.response_cache.close()
+            self.response_cache = None
+        self._recording.close()
+
+    def _emit(self, line: str):
+        """Buffer a line of test output in verbose mode"""
+        if self.verbose:
+            self._out.append(line)
+
+    def flush_output(self):
+        """Write all buffered test output with a single write and flush"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            sys.stdout.flush()
+            self._out.clear()
 
     def log_test(self, name: str, success: bool, details: str = "", response_data: Any = None):
         """Log test results"""
         self.tests_run += 1
         if success:
             self.tests_passed += 1
-            print(f"✅ {name}: PASSED")
+            self._emit(f"✅ {name}: PASSED")
         else:
-            print(f"❌ {name}: FAILED - {details}")
+            self._emit(f"❌ {name}: FAILED - {details}")
         
-        self.test_results.append({
+        # Only failures keep their response body for diagnostics
+        entry = {
             'name': name,
             'success': success,
             'details': details,
-            'response_data': response_data
-        })
+            'response_data': response_data if not success else None
+        }
+        self.test_results.append(entry)
+        self.test_results_by_name[name] = entry
+        if not success:
+            self.failed_tests.append(entry)
+        if success and response_data is not None:
+            self.recent_passed_responses.append((name, response_data))
 
-    def run_test(self, name: str, method: str, endpoint: str, expected_status: int, 
-                 data: Dict = None, headers: Dict = None) -> tuple:
-        """Run a single API test"""
-        url = f"{self.api_url}/{endpoint}"
-        if headers is None:
-            headers = {'Content-Type': 'application/json'}
+    async def run_test(self, name: str, method: str, endpoint: str, expected_status: int, 
+                       data: Dict = None, headers: Dict = None,
+                       timeout: Optional[httpx.Timeout] = None, aid: Optional[str] = None) -> tuple:
+        """Run a single API test, encoding the request body once with orjson when available"""
+        raw_body = json_dumps(data) if data is not None else None
+        return await self.run_test_raw(name, method, endpoint, expected_status, raw_body, headers, timeout, aid)
+
+    async def run_test_raw(self, name: str, method: str, endpoint: str, expected_status: int,
+                           raw_body: Optional[bytes] = None, headers: Dict = None,
+                           timeout: Optional[httpx.Timeout] = None, aid: Optional[str] = None) -> tuple:
+        """Run a single API test against an endpoint key with an already serialized JSON request body"""
+        url = self._urls[endpoint]
+        if aid is not None:
+            url = url.format(aid=aid)
+
+        if method not in ('GET', 'POST'):
+            self.log_test(name, False, f"Unsupported method: {method}")
+            return False, {}
+
+        # Never wait on a request past the suite deadline
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            self.log_test(name, False, "Suite deadline exceeded")
+            return False, {}
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        if remaining < timeout.read:
+            remaining = max(1.0, remaining)
+            timeout = httpx.Timeout(remaining, connect=min(timeout.connect, remaining))
 
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=30)
-            else:
-                self.log_test(name, False, f"Unsupported method: {method}")
-                return False, {}
+            response = await self._send(method, url, raw_body, headers, timeout)
 
             success = response.status_code == expected_status
-            response_data = {}
             
-            try:
-                response_data = response.json()
-            except:
-                response_data = {"raw_response": response.text}
+            # Decode the body bytes once; empty bodies skip the parser entirely and
+            # unparseable ones keep a bounded text excerpt for diagnostics
+            body = response.content
+            response_data = None
+            if not body:
+                response_data = {}
+            elif 'json' in response.headers.get('content-type', ''):
+                try:
+                    response_data = json_loads(body)
+                except ValueError:
+                    pass
+            if response_data is None:
+                response_data = {"raw_response": body[:4096].decode('utf-8', errors='replace')}
 
             if success:
                 self.log_test(name, True, f"Status: {response.status_code}", response_data)
@@ -65,164 +541,85 @@ class TruthDetectorAPITester:
 
             return success, response_data
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self.log_test(name, False, "Request timeout")
             return False, {}
-        except requests.exceptions.ConnectionError:
+        except httpx.TransportError:
             self.log_test(name, False, "Connection error")
             return False, {}
         except Exception as e:
             self.log_test(name, False, f"Error: {str(e)}")
             return False, {}
 
-    def test_health_endpoint(self):
-        """Test health check endpoint"""
-        print("\n🔍 Testing Health Endpoint...")
-        success, response = self.run_test(
-            "Health Check",
-            "GET",
-            "health",
-            200
-        )
-        
-        if success and response:
-            # Validate response structure
-            required_fields = ['status', 'timestamp', 'service']
-            missing_fields = [field for field in required_fields if field not in response]
-            if missing_fields:
-                self.log_test("Health Response Structure", False, f"Missing fields: {missing_fields}")
-            else:
-                self.log_test("Health Response Structure", True, "All required fields present")
-        
-        return success
+    async def _send(self, method: str, url: str, raw_body: Optional[bytes], headers: Optional[Dict],
+                    timeout) -> httpx.Response:
+        """Send a request on the pooled client, retrying transient gateway errors with backoff"""
+        cache = self.response_cache if method == 'GET' else None
+        if cache is not None:
+            response = cache.get(url)
+            if response is not None:
+                return response
+        
+        for attempt in range(self.STATUS_RETRIES + 1):
+            async with self._request_slots:
+                response = await self.client.request(method, url, content=raw_body,
+                                                     headers=headers, timeout=timeout)
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.STATUS_RETRIES:
+                if cache is not None:
+                    cache.put(url, response)
+                return response
+            # Back off without holding a request slot
+            await asyncio.sleep(self.RETRY_BACKOFF * (2 ** attempt))
 
-    def test_truth_demo_endpoint(self):
-        """Test truth demo endpoint"""
-        print("\n🔍 Testing Truth Demo Endpoint...")
-        success, response = self.run_test(
-            "Truth Demo",
-            "POST",
-            "truth-demo",
-            200
-        )
-        
-        if success and response:
-            # Validate demo response structure
-            required_fields = ['message', 'demo_claims_count', 'results']
-            missing_fields = [field for field in required_fields if field not in response]
-            if missing_fields:
-                self.log_test("Demo Response Structure", False, f"Missing fields: {missing_fields}")
-            else:
-                self.log_test("Demo Response Structure", True, "All required fields present")
-                
-                # Validate results structure
-                results = response.get('results', {})
-                result_fields = ['total_claims', 'total_clusters', 'contradictions', 'probable_truths', 'inconsistencies', 'narrative', 'summary']
-                missing_result_fields = [field for field in result_fields if field not in results]
-                if missing_result_fields:
-                    self.log_test("Demo Results Structure", False, f"Missing result fields: {missing_result_fields}")
-                else:
-                    self.log_test("Demo Results Structure", True, "All result fields present")
-        
-        return success, response
+    async def _warm_up(self):
+        """Send one untracked health request so a cold backend starts before the concurrent batch"""
+        try:
+            await self.client.get(self._urls['health'])
+        except httpx.HTTPError:
+            # The Health Check test reports an unreachable server
+            pass
 
-    def test_truth_analyze_custom_claims(self):
-        """Test truth analyze endpoint with custom claims"""
-        print("\n🔍 Testing Truth Analyze with Custom Claims...")
-        
-        # Test with valid claims
-        test_claims = {
-            "claims": [
-                {"text": "The Earth is round", "source_type": "science"},
-                {"text": "The Earth is flat", "source_type": "conspiracy"},
-                {"text": "Water boils at 100°C", "source_type": "science"},
-                {"text": "Exercise is good for health", "source_type": "health"}
-            ]
-        }
-        
-        success, response = self.run_test(
-            "Truth Analyze - Valid Claims",
-            "POST",
-            "truth-analyze",
-            200,
-            test_claims
+    async def _drive(self, check: EndpointCheck) -> tuple:
+        """Run a registry check; returns (request success, response, structure valid)"""
+        success, response = await self.run_test_raw(
+            check.name, check.method, check.endpoint, check.expected_status,
+            check.body, timeout=check.timeout, aid=check.aid
         )
-        
-        analysis_id = None
-        if success and response:
-            # Validate response structure
-            required_fields = ['id', 'timestamp', 'total_claims', 'total_clusters', 'contradictions', 
-                             'probable_truths', 'inconsistencies', 'narrative', 'summary', 'clusters']
-            missing_fields = [field for field in required_fields if field not in response]
-            if missing_fields:
-                self.log_test("Analyze Response Structure", False, f"Missing fields: {missing_fields}")
-            else:
-                self.log_test("Analyze Response Structure", True, "All required fields present")
-                analysis_id = response.get('id')
-        
-        return success, analysis_id
+        if not (success and response and check.required):
+            return success, response, False
+        
+        error = structure_error(check.required, response)
+        if error:
+            self.log_test(check.structure_name, False, error)
+            return success, response, False
+        self.log_test(check.structure_name, True, "All required fields present")
+        
+        if check.sub_required:
+            error = structure_error(check.sub_required, response.get(check.sub_path, {}), "result fields")
+            if error:
+                self.log_test(check.sub_structure_name, False, error)
+                return success, response, False
+            self.log_test(check.sub_structure_name, True, "All result fields present")
+        
+        return success, response, True
 
-    def test_truth_analyze_edge_cases(self):
-        """Test truth analyze endpoint with edge cases"""
-        print("\n🔍 Testing Truth Analyze Edge Cases...")
-        
-        # Test with empty claims
-        empty_claims = {"claims": []}
-        success, _ = self.run_test(
-            "Truth Analyze - Empty Claims",
-            "POST",
-            "truth-analyze",
-            422  # Validation error expected
-        )
-        
-        # Test with invalid claim structure
-        invalid_claims = {"claims": [{"invalid_field": "test"}]}
-        success, _ = self.run_test(
-            "Truth Analyze - Invalid Structure",
-            "POST",
-            "truth-analyze",
-            422  # Validation error expected
-        )
-        
-        # Test with very long claim
-        long_claim = {"claims": [{"text": "x" * 3000, "source_type": "test"}]}
-        success, _ = self.run_test(
-            "Truth Analyze - Long Claim",
-            "POST",
-            "truth-analyze",
-            422  # Should fail validation
-        )
-        
-        # Test with single claim
-        single_claim = {"claims": [{"text": "Single test claim", "source_type": "test"}]}
-        success, _ = self.run_test(
-            "Truth Analyze - Single Claim",
-            "POST",
-            "truth-analyze",
-            200
-        )
+    async def test_truth_analyze_custom_claims(self):
+        """Test truth analyze endpoint with custom claims"""
+        self._emit("\n🔍 Testing Truth Analyze with Custom Claims...")
+        success, response, valid = await self._drive(TRUTH_ANALYZE_CHECK)
+        return success, response.get('id') if valid else None
 
-    def test_contradiction_detection(self):
+    async def test_contradiction_detection(self):
         """Test contradiction detection specifically"""
-        print("\n🔍 Testing Contradiction Detection...")
-        
-        contradictory_claims = {
-            "claims": [
-                {"text": "The sky is blue during the day", "source_type": "observation"},
-                {"text": "The sky is green during the day", "source_type": "false_claim"},
-                {"text": "Water freezes at 0°C", "source_type": "science"},
-                {"text": "Water freezes at 50°C", "source_type": "false_claim"},
-                {"text": "Humans need oxygen to breathe", "source_type": "biology"},
-                {"text": "Humans don't need oxygen to breathe", "source_type": "false_claim"}
-            ]
-        }
+        self._emit("\n🔍 Testing Contradiction Detection...")
         
-        success, response = self.run_test(
+        success, response = await self.run_test_raw(
             "Contradiction Detection",
             "POST",
-            "truth-analyze",
+            "truth_analyze",
             200,
-            contradictory_claims
+            CONTRADICTORY_CLAIMS,
+            timeout=SLOW_TIMEOUT
         )
         
         if success and response:
@@ -239,19 +636,38 @@ class TruthDetectorAPITester:
             else:
                 self.log_test("Inconsistencies Listed", False, "No inconsistencies listed")
 
-    def test_get_analysis_by_id(self, analysis_id: str):
+    def _seed(self, key: str, create):
+        """Start a creating test once per run; every caller awaits the same task"""
+        task = self._seeds.get(key)
+        if task is None:
+            task = self._seeds[key] = asyncio.ensure_future(create())
+        return task
+
+    async def seeded_analysis_id(self) -> Optional[str]:
+        """ID of the custom-claims analysis, created on first use"""
+        _, analysis_id = await self._seed('truth', self.test_truth_analyze_custom_claims)
+        return analysis_id
+
+    async def seeded_dual_analysis_id(self) -> Optional[str]:
+        """ID of the mixed-claims dual pipeline analysis, created on first use"""
+        _, analysis_id = await self._seed('dual', self.test_dual_pipeline_analyze_mixed_claims)
+        return analysis_id
+
+    async def test_get_analysis_by_id(self):
         """Test getting analysis by ID"""
+        analysis_id = await self.seeded_analysis_id()
         if not analysis_id:
             self.log_test("Get Analysis by ID", False, "No analysis ID provided")
             return
             
-        print(f"\n🔍 Testing Get Analysis by ID: {analysis_id}...")
+        self._emit(f"\n🔍 Testing Get Analysis by ID: {analysis_id}...")
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Analysis by ID",
             "GET",
-            f"truth-analyze/{analysis_id}",
-            200
+            "truth_analysis",
+            200,
+            aid=analysis_id
         )
         
         if success and response:
@@ -261,26 +677,14 @@ class TruthDetectorAPITester:
             else:
                 self.log_test("Analysis ID Match", False, f"Expected ID {analysis_id}, got {response.get('id')}")
 
-    def test_get_nonexistent_analysis(self):
-        """Test getting non-existent analysis"""
-        print("\n🔍 Testing Get Non-existent Analysis...")
-        
-        fake_id = "non-existent-id-12345"
-        success, response = self.run_test(
-            "Get Non-existent Analysis",
-            "GET",
-            f"truth-analyze/{fake_id}",
-            404
-        )
-
-    def test_list_analyses(self):
+    async def test_list_analyses(self):
         """Test listing analyses"""
-        print("\n🔍 Testing List Analyses...")
+        self._emit("\n🔍 Testing List Analyses...")
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "List Analyses",
             "GET",
-            "truth-analyze",
+            "truth_analyze",
             200
         )
         
@@ -290,28 +694,17 @@ class TruthDetectorAPITester:
             else:
                 self.log_test("List Response Type", False, f"Expected list, got {type(response)}")
 
-    def test_clustering_algorithm(self):
+    async def test_clustering_algorithm(self):
         """Test clustering with similar claims"""
-        print("\n🔍 Testing Clustering Algorithm...")
-        
-        similar_claims = {
-            "claims": [
-                {"text": "Exercise improves cardiovascular health", "source_type": "medical"},
-                {"text": "Physical activity is good for the heart", "source_type": "health"},
-                {"text": "Working out strengthens the cardiovascular system", "source_type": "fitness"},
-                {"text": "The Earth orbits around the Sun", "source_type": "astronomy"},
-                {"text": "Our planet revolves around the solar system's star", "source_type": "science"},
-                {"text": "Eating vegetables provides essential nutrients", "source_type": "nutrition"},
-                {"text": "Consuming plant foods gives important vitamins", "source_type": "dietary"}
-            ]
-        }
+        self._emit("\n🔍 Testing Clustering Algorithm...")
         
-        success, response = self.run_test(
+        success, response = await self.run_test_raw(
             "Clustering Algorithm",
             "POST",
-            "truth-analyze",
+            "truth_analyze",
             200,
-            similar_claims
+            SIMILAR_CLAIMS,
+            timeout=SLOW_TIMEOUT
         )
         
         if success and response:
@@ -324,26 +717,35 @@ class TruthDetectorAPITester:
             else:
                 self.log_test("Clustering Effectiveness", False, f"No clustering occurred: {total_claims} claims, {total_clusters} clusters")
 
-    def test_source_diversity_weighting(self):
+    async def test_stopword_claims(self):
+        """Test that claims with no vocabulary still get analyzed"""
+        self._emit("\n🔍 Testing Stop-Word-Only Claims...")
+        
+        success, response = await self.run_test_raw(
+            "Truth Analyze - Stop Words Only",
+            "POST",
+            "truth_analyze",
+            200,
+            STOPWORD_CLAIMS
+        )
+        
+        if success and response:
+            error = response.get('error')
+            if error:
+                self.log_test("Empty Vocabulary Fallback", False, f"Analysis failed: {error}")
+            else:
+                self.log_test("Empty Vocabulary Fallback", True, f"Got {response.get('total_clusters', 0)} clusters")
+
+    async def test_source_diversity_weighting(self):
         """Test source diversity weighting"""
-        print("\n🔍 Testing Source Diversity Weighting...")
-        
-        diverse_sources = {
-            "claims": [
-                {"text": "Climate change is caused by human activities", "source_type": "science"},
-                {"text": "Climate change is caused by human activities", "source_type": "government"},
-                {"text": "Climate change is caused by human activities", "source_type": "academic"},
-                {"text": "Climate change is caused by human activities", "source_type": "expert"},
-                {"text": "Climate change is natural", "source_type": "opinion"}
-            ]
-        }
+        self._emit("\n🔍 Testing Source Diversity Weighting...")
         
-        success, response = self.run_test(
+        success, response = await self.run_test_raw(
             "Source Diversity Weighting",
             "POST",
-            "truth-analyze",
+            "truth_analyze",
             200,
-            diverse_sources
+            DIVERSE_SOURCES
         )
         
         if success and response:
@@ -357,177 +759,93 @@ class TruthDetectorAPITester:
                 else:
                     self.log_test("Source Diversity Impact", False, "No truths with multiple sources found")
 
-    def test_dual_pipeline_demo(self):
+    async def test_dual_pipeline_demo(self):
         """Test dual pipeline demo endpoint"""
-        print("\n🔍 Testing Dual Pipeline Demo...")
-        success, response = self.run_test(
-            "Dual Pipeline Demo",
-            "POST",
-            "dual-pipeline-demo",
-            200
-        )
+        self._emit("\n🔍 Testing Dual Pipeline Demo...")
+        success, response, valid = await self._drive(DUAL_DEMO_CHECK)
         
-        if success and response:
-            # Validate demo response structure
-            required_fields = ['message', 'demo_claims_count', 'results']
-            missing_fields = [field for field in required_fields if field not in response]
-            if missing_fields:
-                self.log_test("Dual Pipeline Demo Structure", False, f"Missing fields: {missing_fields}")
+        if valid:
+            results = response['results']
+            
+            # Test claim separation
+            total_claims = results.get('total_claims', 0)
+            factual_claims = results.get('factual_claims', 0)
+            emotional_claims = results.get('emotional_claims', 0)
+            
+            if factual_claims + emotional_claims == total_claims:
+                self.log_test("Claim Separation Logic", True, f"Claims properly separated: {factual_claims} factual, {emotional_claims} emotional")
             else:
-                self.log_test("Dual Pipeline Demo Structure", True, "All required fields present")
-                
-                # Validate results structure
-                results = response.get('results', {})
-                result_fields = ['total_claims', 'factual_claims', 'emotional_claims', 'factual_loci', 'emotional_variants', 'fair_witness_narrative', 'dual_pipeline_summary']
-                missing_result_fields = [field for field in result_fields if field not in results]
-                if missing_result_fields:
-                    self.log_test("Dual Pipeline Results Structure", False, f"Missing result fields: {missing_result_fields}")
-                else:
-                    self.log_test("Dual Pipeline Results Structure", True, "All result fields present")
-                    
-                    # Test claim separation
-                    total_claims = results.get('total_claims', 0)
-                    factual_claims = results.get('factual_claims', 0)
-                    emotional_claims = results.get('emotional_claims', 0)
-                    
-                    if factual_claims + emotional_claims == total_claims:
-                        self.log_test("Claim Separation Logic", True, f"Claims properly separated: {factual_claims} factual, {emotional_claims} emotional")
-                    else:
-                        self.log_test("Claim Separation Logic", False, f"Separation mismatch: {factual_claims} + {emotional_claims} != {total_claims}")
-                    
-                    # Test Fair Witness narrative
-                    narrative = results.get('fair_witness_narrative', '')
-                    if 'FAIR WITNESS' in narrative and 'FACTUAL NARRATIVE' in narrative:
-                        self.log_test("Fair Witness Narrative", True, "Narrative contains expected sections")
-                    else:
-                        self.log_test("Fair Witness Narrative", False, "Narrative missing expected sections")
+                self.log_test("Claim Separation Logic", False, f"Separation mismatch: {factual_claims} + {emotional_claims} != {total_claims}")
+            
+            # Test Fair Witness narrative
+            narrative = results.get('fair_witness_narrative', '')
+            if 'FAIR WITNESS' in narrative and 'FACTUAL NARRATIVE' in narrative:
+                self.log_test("Fair Witness Narrative", True, "Narrative contains expected sections")
+            else:
+                self.log_test("Fair Witness Narrative", False, "Narrative missing expected sections")
         
         return success, response
 
-    def test_dual_pipeline_analyze_mixed_claims(self):
+    async def test_dual_pipeline_analyze_mixed_claims(self):
         """Test dual pipeline analyze with mixed factual/emotional claims"""
-        print("\n🔍 Testing Dual Pipeline with Mixed Claims...")
-        
-        mixed_claims = {
-            "claims": [
-                # Factual claims
-                {"text": "The temperature was recorded at 25°C at 3:00 PM", "source_type": "weather_station"},
-                {"text": "According to the study, water boils at 100°C at sea level", "source_type": "science"},
-                {"text": "The building is located at 123 Main Street", "source_type": "official_record"},
-                
-                # Emotional claims
-                {"text": "I was absolutely terrified when I saw the accident", "source_type": "witness"},
-                {"text": "The whole situation seemed incredibly confusing to me", "source_type": "witness"},
-                {"text": "I think this is the most amazing discovery ever made", "source_type": "opinion"},
-                
-                # Mixed claims
-                {"text": "The terrifying collision occurred at 3:42 PM at Main Street", "source_type": "news"},
-                {"text": "Scientists are excited about this groundbreaking research", "source_type": "news"}
-            ]
-        }
-        
-        success, response = self.run_test(
-            "Dual Pipeline Mixed Claims",
-            "POST",
-            "dual-pipeline-analyze",
-            200,
-            mixed_claims
-        )
+        self._emit("\n🔍 Testing Dual Pipeline with Mixed Claims...")
+        success, response, valid = await self._drive(DUAL_MIXED_CHECK)
         
         analysis_id = None
-        if success and response:
-            # Validate response structure
-            required_fields = ['id', 'timestamp', 'total_claims', 'factual_claims', 'emotional_claims', 
-                             'factual_loci', 'emotional_variants', 'fair_witness_narrative', 'dual_pipeline_summary', 'processing_details']
-            missing_fields = [field for field in required_fields if field not in response]
-            if missing_fields:
-                self.log_test("Mixed Claims Response Structure", False, f"Missing fields: {missing_fields}")
+        if valid:
+            analysis_id = response.get('id')
+            
+            # Test processing details
+            processing_details = response.get('processing_details', {})
+            if 'factual_pipeline' in processing_details and 'emotional_pipeline' in processing_details:
+                self.log_test("Processing Details", True, "Both pipeline details present")
             else:
-                self.log_test("Mixed Claims Response Structure", True, "All required fields present")
-                analysis_id = response.get('id')
-                
-                # Test processing details
-                processing_details = response.get('processing_details', {})
-                if 'factual_pipeline' in processing_details and 'emotional_pipeline' in processing_details:
-                    self.log_test("Processing Details", True, "Both pipeline details present")
-                else:
-                    self.log_test("Processing Details", False, "Missing pipeline details")
+                self.log_test("Processing Details", False, "Missing pipeline details")
         
         return success, analysis_id
 
-    def test_dual_pipeline_pure_factual(self):
-        """Test dual pipeline with only factual claims"""
-        print("\n🔍 Testing Dual Pipeline with Pure Factual Claims...")
-        
-        factual_claims = {
-            "claims": [
-                {"text": "The experiment was conducted at 20°C temperature", "source_type": "science"},
-                {"text": "Data shows that the reaction occurred at 15:30 hours", "source_type": "lab_report"},
-                {"text": "According to measurements, the distance is 150 meters", "source_type": "survey"},
-                {"text": "The building was constructed in 1995", "source_type": "official_record"}
-            ]
-        }
+    async def test_dual_pipeline_pure_case(self, kind: str, body: bytes, other_kind: str):
+        """Test that a batch of one kind of claim is classified entirely as that kind"""
+        label = kind.capitalize()
+        self._emit(f"\n🔍 Testing Dual Pipeline with Pure {label} Claims...")
         
-        success, response = self.run_test(
-            "Dual Pipeline Pure Factual",
+        success, response = await self.run_test_raw(
+            f"Dual Pipeline Pure {label}",
             "POST",
-            "dual-pipeline-analyze",
+            "dual_analyze",
             200,
-            factual_claims
+            body
         )
         
         if success and response:
-            factual_claims_count = response.get('factual_claims', 0)
-            emotional_claims_count = response.get('emotional_claims', 0)
+            count = response.get(f'{kind}_claims', 0)
+            other_count = response.get(f'{other_kind}_claims', 0)
             
-            if factual_claims_count > 0 and emotional_claims_count == 0:
-                self.log_test("Pure Factual Classification", True, f"Correctly identified {factual_claims_count} factual claims, {emotional_claims_count} emotional")
+            if count > 0 and other_count == 0:
+                self.log_test(f"Pure {label} Classification", True, f"Correctly identified {count} {kind} claims, {other_count} {other_kind}")
             else:
-                self.log_test("Pure Factual Classification", False, f"Incorrect classification: {factual_claims_count} factual, {emotional_claims_count} emotional")
-
-    def test_dual_pipeline_pure_emotional(self):
-        """Test dual pipeline with only emotional claims"""
-        print("\n🔍 Testing Dual Pipeline with Pure Emotional Claims...")
-        
-        emotional_claims = {
-            "claims": [
-                {"text": "I feel absolutely devastated by this news", "source_type": "social_media"},
-                {"text": "This seems like the most confusing situation ever", "source_type": "opinion"},
-                {"text": "I think this is incredibly beautiful and amazing", "source_type": "review"},
-                {"text": "The whole experience was terrifyingly intense", "source_type": "personal_account"}
-            ]
-        }
-        
-        success, response = self.run_test(
-            "Dual Pipeline Pure Emotional",
-            "POST",
-            "dual-pipeline-analyze",
-            200,
-            emotional_claims
-        )
-        
-        if success and response:
-            factual_claims_count = response.get('factual_claims', 0)
-            emotional_claims_count = response.get('emotional_claims', 0)
-            
-            if emotional_claims_count > 0 and factual_claims_count == 0:
-                self.log_test("Pure Emotional Classification", True, f"Correctly identified {emotional_claims_count} emotional claims, {factual_claims_count} factual")
-            else:
-                self.log_test("Pure Emotional Classification", False, f"Incorrect classification: {emotional_claims_count} emotional, {factual_claims_count} factual")
+                self.log_test(f"Pure {label} Classification", False, f"Incorrect classification: {count} {kind}, {other_count} {other_kind}")
 
-    def test_dual_pipeline_get_analysis(self, analysis_id: str):
+    async def test_dual_pipeline_pure_claims(self):
+        """Test dual pipeline with only factual and with only emotional claims"""
+        await asyncio.gather(*[self.test_dual_pipeline_pure_case(kind, body, other_kind)
+                               for kind, body, other_kind in PURE_CASES])
+
+    async def test_dual_pipeline_get_analysis(self):
         """Test getting dual pipeline analysis by ID"""
+        analysis_id = await self.seeded_dual_analysis_id()
         if not analysis_id:
             self.log_test("Get Dual Pipeline Analysis by ID", False, "No analysis ID provided")
             return
             
-        print(f"\n🔍 Testing Get Dual Pipeline Analysis by ID: {analysis_id}...")
+        self._emit(f"\n🔍 Testing Get Dual Pipeline Analysis by ID: {analysis_id}...")
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Dual Pipeline Analysis by ID",
             "GET",
-            f"dual-pipeline-analyze/{analysis_id}",
-            200
+            "dual_analysis",
+            200,
+            aid=analysis_id
         )
         
         if success and response:
@@ -537,14 +855,14 @@ class TruthDetectorAPITester:
             else:
                 self.log_test("Dual Pipeline Analysis ID Match", False, f"Expected ID {analysis_id}, got {response.get('id')}")
 
-    def test_dual_pipeline_list_analyses(self):
+    async def test_dual_pipeline_list_analyses(self):
         """Test listing dual pipeline analyses"""
-        print("\n🔍 Testing List Dual Pipeline Analyses...")
+        self._emit("\n🔍 Testing List Dual Pipeline Analyses...")
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "List Dual Pipeline Analyses",
             "GET",
-            "dual-pipeline-analyze",
+            "dual_analyze",
             200
         )
         
@@ -554,79 +872,42 @@ class TruthDetectorAPITester:
             else:
                 self.log_test("Dual Pipeline List Response Type", False, f"Expected list, got {type(response)}")
 
-    def test_dual_pipeline_url_analysis(self):
+    async def test_dual_pipeline_url_analysis(self):
         """Test dual pipeline URL analysis"""
-        print("\n🔍 Testing Dual Pipeline URL Analysis...")
+        self._emit("\n🔍 Testing Dual Pipeline URL Analysis...")
+        name = "Dual Pipeline URL Analysis"
         
-        # Test with a simple URL structure (this might fail if URL extraction doesn't work)
-        url_batch = {
-            "urls": [
-                {"url": "https://example.com", "source_type": "news"}
-            ]
-        }
-        
-        success, response = self.run_test(
-            "Dual Pipeline URL Analysis",
-            "POST",
-            "analyze-urls-dual-pipeline",
-            200,  # Expect success if URL extraction works, or 400 if it fails
-            url_batch
-        )
-        
-        # Note: This test might fail due to URL extraction issues, which is acceptable
-        if not success:
-            self.log_test("Dual Pipeline URL Analysis", True, "URL extraction failed as expected (external dependency)")
-
-    def test_dual_pipeline_edge_cases(self):
-        """Test dual pipeline edge cases"""
-        print("\n🔍 Testing Dual Pipeline Edge Cases...")
-        
-        # Test with empty claims
-        empty_claims = {"claims": []}
-        success, _ = self.run_test(
-            "Dual Pipeline Empty Claims",
-            "POST",
-            "dual-pipeline-analyze",
-            422  # Validation error expected
-        )
+        # Sent directly rather than through run_test_raw: a slow or failed external
+        # fetch is acceptable here and must be logged once, as a pass
+        try:
+            # A slow external fetch adds no signal; give up early rather than hold the run
+            response = await self._send("POST", self._urls['dual_urls'], URL_BATCH, None, URL_TIMEOUT)
+        except httpx.TimeoutException:
+            self.external_failures.append(f"{name}: URL extraction timed out")
+            self.log_test(name, True, "URL extraction timed out (external dependency)")
+            return
+        except httpx.TransportError:
+            self.log_test(name, False, "Connection error")
+            return
         
-        # Test with single claim
-        single_claim = {"claims": [{"text": "Single test claim for dual pipeline", "source_type": "test"}]}
-        success, _ = self.run_test(
-            "Dual Pipeline Single Claim",
-            "POST",
-            "dual-pipeline-analyze",
-            200
-        )
+        # Expect success if URL extraction works; a failed extraction is acceptable
+        if response.status_code == 200:
+            self.log_test(name, True, f"Status: {response.status_code}")
+        else:
+            self.external_failures.append(f"{name}: URL extraction returned {response.status_code}")
+            self.log_test(name, True, f"URL extraction failed as expected (external dependency): "
+                                      f"status {response.status_code}")
 
-    def test_sentiment_analysis_accuracy(self):
+    async def test_sentiment_analysis_accuracy(self):
         """Test sentiment analysis accuracy in claim classification"""
-        print("\n🔍 Testing Sentiment Analysis Accuracy...")
+        self._emit("\n🔍 Testing Sentiment Analysis Accuracy...")
         
-        sentiment_test_claims = {
-            "claims": [
-                # Clearly factual (should be classified as factual)
-                {"text": "The temperature measured 25 degrees Celsius", "source_type": "measurement"},
-                {"text": "According to the data, the event occurred at 3:00 PM", "source_type": "report"},
-                
-                # Clearly emotional (should be classified as emotional)
-                {"text": "I absolutely hate this terrible situation", "source_type": "opinion"},
-                {"text": "This is the most beautiful thing I have ever seen", "source_type": "review"},
-                
-                # Neutral factual (should be classified as factual)
-                {"text": "The building has 10 floors", "source_type": "architecture"},
-                
-                # Strong emotional (should be classified as emotional)
-                {"text": "I am devastated and completely heartbroken", "source_type": "personal"}
-            ]
-        }
-        
-        success, response = self.run_test(
+        success, response = await self.run_test_raw(
             "Sentiment Analysis Accuracy",
             "POST",
-            "dual-pipeline-analyze",
+            "dual_analyze",
             200,
-            sentiment_test_claims
+            SENTIMENT_TEST_CLAIMS
         )
         
         if success and response:
@@ -645,54 +926,64 @@ class TruthDetectorAPITester:
 
     def run_all_tests(self):
         """Run all tests including dual pipeline tests"""
+        return asyncio.run(self._run_all_async())
+
+    async def _run_all_async(self):
+        """Run every test concurrently on one pooled client"""
         print("🚀 Starting Comprehensive Truth Detector API Testing...")
-        print(f"Testing against: {self.base_url}")
-        print("=" * 60)
-        
-        # Basic endpoint tests
-        self.test_health_endpoint()
-        demo_success, demo_response = self.test_truth_demo_endpoint()
-        
-        # Custom analysis tests
-        analyze_success, analysis_id = self.test_truth_analyze_custom_claims()
-        self.test_truth_analyze_edge_cases()
-        
-        # Advanced algorithm tests
-        self.test_contradiction_detection()
-        self.test_clustering_algorithm()
-        self.test_source_diversity_weighting()
-        
-        # Analysis retrieval tests
-        if analysis_id:
-            self.test_get_analysis_by_id(analysis_id)
-        self.test_get_nonexistent_analysis()
-        self.test_list_analyses()
-        
-        # === DUAL PIPELINE TESTS ===
-        print("\n" + "=" * 60)
-        print("🔬 DUAL PIPELINE SYSTEM TESTS")
+        print(f"Testing against: {self.base_url} (override with TRUTH_API_URL or a command-line argument)")
         print("=" * 60)
         
-        # Core dual pipeline functionality
-        dual_demo_success, dual_demo_response = self.test_dual_pipeline_demo()
-        dual_mixed_success, dual_analysis_id = self.test_dual_pipeline_analyze_mixed_claims()
-        
-        # Pipeline-specific tests
-        self.test_dual_pipeline_pure_factual()
-        self.test_dual_pipeline_pure_emotional()
-        
-        # Dual pipeline retrieval tests
-        if dual_analysis_id:
-            self.test_dual_pipeline_get_analysis(dual_analysis_id)
-        self.test_dual_pipeline_list_analyses()
-        
-        # Advanced dual pipeline tests
-        self.test_dual_pipeline_url_analysis()
-        self.test_dual_pipeline_edge_cases()
-        self.test_sentiment_analysis_accuracy()
+        self._open()
+        try:
+            await self._warm_up()
+            
+            # All tests run concurrently, so their network round trips overlap
+            # instead of adding up; retrieval by ID starts as soon as its seeded
+            # analysis has been created
+            await asyncio.gather(
+                # Create the seeded analyses, then retrieve them by ID
+                self.test_get_analysis_by_id(),
+                self.test_dual_pipeline_get_analysis(),
+                
+                # Status and structure checks from the registry
+                *[self._drive(check) for check in ENDPOINT_CHECKS],
+                
+                # Advanced algorithm tests
+                self.test_contradiction_detection(),
+                self.test_clustering_algorithm(),
+                self.test_stopword_claims(),
+                self.test_source_diversity_weighting(),
+                self.test_list_analyses(),
+                
+                # === DUAL PIPELINE TESTS ===
+                self.test_dual_pipeline_demo(),
+                self.test_dual_pipeline_pure_claims(),
+                self.test_dual_pipeline_list_analyses(),
+                self.test_dual_pipeline_url_analysis(),
+                self.test_sentiment_analysis_accuracy()
+            )
+        finally:
+            await self.close()
+            self.flush_output()
         
         # Print final results
-        self.print_final_results()
+        return self.print_final_results()
+
+    def run_one(self, test) -> List[Dict[str, Any]]:
+        """Run one test coroutine on its own client; returns the failed results"""
+        return asyncio.run(self._run_one_async(test))
+
+    async def _run_one_async(self, test) -> List[Dict[str, Any]]:
+        """Open a client for a single test, run it and close the client again"""
+        # Under pytest each test function records to its own cassette
+        self._open(os.environ.get('PYTEST_CURRENT_TEST', 'backend_test').split('::')[-1].split(' ')[0])
+        try:
+            await test(self)
+        finally:
+            await self.close()
+            self.flush_output()
+        return self.failed_tests
 
     def print_final_results(self):
         """Print comprehensive test results"""
@@ -706,24 +997,89 @@ class TruthDetectorAPITester:
         print(f"Success Rate: {(self.tests_passed / self.tests_run * 100):.1f}%")
         
         # Show failed tests
-        failed_tests = [test for test in self.test_results if not test['success']]
-        if failed_tests:
-            print(f"\n❌ FAILED TESTS ({len(failed_tests)}):")
-            for test in failed_tests:
+        if self.failed_tests:
+            print(f"\n❌ FAILED TESTS ({len(self.failed_tests)}):")
+            for test in self.failed_tests:
                 print(f"  - {test['name']}: {test['details']}")
         
         # Show successful critical tests
-        critical_tests = ['Health Check', 'Truth Demo', 'Truth Analyze - Valid Claims', 'Contradiction Detection']
-        critical_passed = [test for test in self.test_results if test['name'] in critical_tests and test['success']]
-        print(f"\n✅ CRITICAL TESTS PASSED ({len(critical_passed)}/{len(critical_tests)}):")
-        for test in critical_passed:
-            print(f"  - {test['name']}")
+        critical_passed = [name for name in sorted(CRITICAL_TESTS)
+                           if self.test_results_by_name.get(name, {}).get('success')]
+        print(f"\n✅ CRITICAL TESTS PASSED ({len(critical_passed)}/{len(CRITICAL_TESTS)}):")
+        for name in critical_passed:
+            print(f"  - {name}")
+        
+        # Machine-readable results for CI, written as one batch
+        if self.json_report:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(json_dumps_pretty(self.test_results) + b"\n")
+            sys.stdout.buffer.flush()
         
         return self.tests_passed == self.tests_run
 
-def main():
-    """Main test execution"""
+# pytest entry points. Each test runs on its own tester, so pytest-xdist can
+# spread them over worker processes: pytest -n auto backend_test.py.
+# They need a live backend, so collection is skipped unless TRUTH_API_URL is set
+if 'pytest' in sys.modules:
+    import pytest
+    if not os.environ.get('TRUTH_API_URL'):
+        pytest.skip("set TRUTH_API_URL to run the API tests", allow_module_level=True)
+
+def _check(test) -> TruthDetectorAPITester:
     tester = TruthDetectorAPITester()
+    failures = tester.run_one(test)
+    assert not failures, "; ".join(f"{result['name']}: {result['details']}" for result in failures)
+    return tester
+
+def test_endpoint_checks():
+    _check(lambda tester: asyncio.gather(*[tester._drive(check) for check in ENDPOINT_CHECKS]))
+
+def test_get_analysis_by_id():
+    _check(lambda tester: tester.test_get_analysis_by_id())
+
+def test_contradiction_detection():
+    _check(lambda tester: tester.test_contradiction_detection())
+
+def test_clustering_algorithm():
+    _check(lambda tester: tester.test_clustering_algorithm())
+
+def test_stopword_claims():
+    _check(lambda tester: tester.test_stopword_claims())
+
+def test_source_diversity_weighting():
+    _check(lambda tester: tester.test_source_diversity_weighting())
+
+def test_list_analyses():
+    _check(lambda tester: tester.test_list_analyses())
+
+def test_dual_pipeline_demo():
+    _check(lambda tester: tester.test_dual_pipeline_demo())
+
+def test_dual_pipeline_get_analysis():
+    _check(lambda tester: tester.test_dual_pipeline_get_analysis())
+
+def test_dual_pipeline_pure_claims():
+    _check(lambda tester: tester.test_dual_pipeline_pure_claims())
+
+def test_dual_pipeline_list_analyses():
+    _check(lambda tester: tester.test_dual_pipeline_list_analyses())
+
+def test_dual_pipeline_url_analysis():
+    tester = _check(lambda tester: tester.test_dual_pipeline_url_analysis())
+    if tester.external_failures:
+        pytest.skip("; ".join(tester.external_failures))
+
+def test_sentiment_analysis_accuracy():
+    _check(lambda tester: tester.test_sentiment_analysis_accuracy())
+
+def main():
+    """Main test execution; an optional first argument overrides the API base URL"""
+    flags = {arg for arg in sys.argv[1:] if arg.startswith('--')}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if '--clear-cache' in flags and os.path.exists(ResponseCache.PATH):
+        os.remove(ResponseCache.PATH)
+    tester = TruthDetectorAPITester(args[0] if args else None,
+                                    verbose='--verbose' in flags, json_report='--json' in flags)
     
     try:
         success = tester.run_all_tests()
@@ -4,31 +4,74 @@ News Intelligence Platform - News API Endpoints
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
+import asyncio
 import logging
+import time
 
 from models.news_models import NewsArticle, StoryCluster, ProcessingJob
 from services.feed_manager import NewsFeedManager
 from services.story_clustering import StoryClusteringEngine
 from services.impact_assessment import ImpactAssessmentEngine
 from workers.daily_processor import daily_processor
+from core.config import FREE_NEWS_SOURCES
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/news", tags=["news"])
 
+# Stateless engines shared across requests. Feed managers stay per request
+# because each one deduplicates against the URLs it has already seen.
+clustering_engine = StoryClusteringEngine()
+impact_engine = ImpactAssessmentEngine()
+
+# Processing status is polled frequently by the UI; reuse it briefly
+STATUS_CACHE_TTL = 0.5
+
+class _StatusCache:
+    """Processing status shared by callers within STATUS_CACHE_TTL of each other"""
+    __slots__ = ('status', 'built_at')
+    
+    def __init__(self):
+        self.status: Optional[dict] = None
+        self.built_at = 0.0
+    
+    async def get(self) -> dict:
+        now = time.monotonic()
+        if self.status is None or now - self.built_at > STATUS_CACHE_TTL:
+            self.status = await daily_processor.get_processing_status()
+            self.built_at = now
+        return self.status
+    
+    def invalidate(self):
+        """Drop the cached status after processing is started or cancelled"""
+        self.status = None
+
+status_cache = _StatusCache()
+
+# Static parts of the status and feed configuration responses, built once at import
+NEWS_API_INFO = {
+    "message": "News Intelligence Platform API v1.0",
+    "status": "operational",
+    "features": {
+        "feed_polling": "active",
+        "story_clustering": "active",
+        "impact_assessment": "placeholder_ready",
+        "dual_pipeline": "active",
+        "report_generation": "active"
+    }
+}
+FEEDS_CONFIG = {
+    "rss_feeds": FREE_NEWS_SOURCES["rss_feeds"],
+    "total_feeds": len(FREE_NEWS_SOURCES["rss_feeds"]),
+    "feed_categories": sorted({feed["category"] for feed in FREE_NEWS_SOURCES["rss_feeds"]}),
+    "perspectives_covered": sorted({feed["perspective"] for feed in FREE_NEWS_SOURCES["rss_feeds"]})
+}
+
 @router.get("/", summary="News Intelligence API Status")
 async def news_api_status():
     """Get API status and configuration"""
     return {
-        "message": "News Intelligence Platform API v1.0",
-        "status": "operational",
-        "features": {
-            "feed_polling": "active",
-            "story_clustering": "active", 
-            "impact_assessment": "placeholder_ready",
-            "dual_pipeline": "active",
-            "report_generation": "active"
-        },
-        "processing": await daily_processor.get_processing_status(),
+        **NEWS_API_INFO,
+        "processing": await status_cache.get(),
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -42,7 +85,7 @@ async def poll_news_feeds():
         return {
             "status": "success",
             "articles_collected": len(articles),
-            "sources": list(set(article.source for article in articles)),
+            "sources": sorted({article.source for article in articles}),
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
@@ -54,7 +97,6 @@ async def cluster_articles(timeframe_hours: int = Query(24, description="Timefra
     """Manually trigger article clustering"""
     try:
         feed_manager = NewsFeedManager()
-        clustering_engine = StoryClusteringEngine()
         
         # Get recent articles
         articles = await feed_manager.get_articles_by_timeframe(timeframe_hours)
@@ -79,7 +121,7 @@ async def cluster_articles(timeframe_hours: int = Query(24, description="Timefra
                 "source_diversity": cluster.source_diversity_score,
                 "perspectives": cluster.perspective_coverage,
                 "first_seen": cluster.first_seen.isoformat(),
-                "sources": [article.source for article in cluster.articles]
+                "sources": sorted({article.source for article in cluster.articles})
             })
         
         return {
@@ -99,8 +141,6 @@ async def assess_story_impact(timeframe_hours: int = Query(24), top_n: int = Que
     """Assess impact and rank top stories"""
     try:
         feed_manager = NewsFeedManager()
-        clustering_engine = StoryClusteringEngine()
-        impact_engine = ImpactAssessmentEngine()
         
         # Get and cluster articles
         articles = await feed_manager.get_articles_by_timeframe(timeframe_hours)
@@ -138,8 +178,7 @@ async def assess_story_impact(timeframe_hours: int = Query(24), top_n: int = Que
 async def get_processing_status():
     """Get current processing status"""
     try:
-        status = await daily_processor.get_processing_status()
-        return status
+        return await status_cache.get()
     except Exception as e:
         logger.error(f"Error getting processing status: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Status check failed: {str(e)}")
@@ -152,6 +191,7 @@ async def trigger_manual_processing(background_tasks: BackgroundTasks):
             raise HTTPException(status_code=409, detail="Processing already in progress")
         
         job_id = await daily_processor.run_manual_processing()
+        status_cache.invalidate()
         
         return {
             "status": "started",
@@ -171,6 +211,7 @@ async def cancel_processing():
     """Cancel currently running processing"""
     try:
         cancelled = await daily_processor.cancel_current_processing()
+        status_cache.invalidate()
         
         if cancelled:
             return {
@@ -192,14 +233,7 @@ async def cancel_processing():
 @router.get("/feeds-config", summary="Get Feed Configuration")
 async def get_feeds_config():
     """Get current news feed configuration"""
-    from core.config import FREE_NEWS_SOURCES
-    
-    return {
-        "rss_feeds": FREE_NEWS_SOURCES["rss_feeds"],
-        "total_feeds": len(FREE_NEWS_SOURCES["rss_feeds"]),
-        "feed_categories": list(set(feed["category"] for feed in FREE_NEWS_SOURCES["rss_feeds"])),
-        "perspectives_covered": list(set(feed["perspective"] for feed in FREE_NEWS_SOURCES["rss_feeds"]))
-    }
+    return FEEDS_CONFIG
 
 @router.get("/test-extraction", summary="Test Content Extraction")
 async def test_content_extraction(url: str = Query(..., description="URL to test content extraction")):
@@ -208,8 +242,11 @@ async def test_content_extraction(url: str = Query(..., description="URL to test
         from utils.content_extractor import ContentExtractor
         
         extractor = ContentExtractor()
-        content = await extractor.extract_content(url)
-        metadata = await extractor.extract_metadata(url)
+        # Content and metadata are fetched independently, so overlap the two downloads
+        content, metadata = await asyncio.gather(
+            extractor.extract_content(url),
+            extractor.extract_metadata(url)
+        )
         
         return {
             "status": "success",
@@ -234,14 +271,7 @@ async def get_recent_articles(
     """Get recent articles from feeds"""
     try:
         feed_manager = NewsFeedManager()
-        articles = await feed_manager.get_articles_by_timeframe(hours)
-        
-        # Filter by source if specified
-        if source:
-            articles = [article for article in articles if article.source == source]
-        
-        # Limit results
-        articles = articles[:limit]
+        articles = await feed_manager.get_articles_by_timeframe(hours, source=source, limit=limit)
         
         # Format response
         article_summaries = []
@@ -1,29 +1,100 @@
 """
 News Intelligence Platform - Report API Endpoints
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime, date
+import asyncio
+import functools
 import os
+import re
+import time
 import json
 import logging
 from pathlib import Path
 
 from services.report_generator import JournalistReportGenerator
+from services.report_search import search_reports_cached
 from core.config import settings
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
+# Report directories are named YYYY-MM-DD
+DATE_DIR_RE = re.compile(r'^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$')
+DATE_INDEX_TTL = 60.0
+# Generated report files never change, so clients may keep them for a day
+REPORT_CACHE_CONTROL = "public, max-age=86400, immutable"
+# Downloadable story report files by file type
+ReportFileType = Literal["markdown", "briefing", "source_analysis", "breakdown"]
+REPORT_FILES = {
+    "markdown": "comprehensive-report.md",
+    "briefing": "anchor-briefing.json",
+    "source_analysis": "source-analysis.json",
+    "breakdown": "factual-emotional-breakdown.json"
+}
+# Stories previewed by a single batch request
+MAX_BATCH_PREVIEWS = 100
+# Report files scanned at once by the search fallback
+SEARCH_SCAN_CONCURRENCY = 32
+
+def _parse_report_date(value: str) -> Optional[date]:
+    """Date for a YYYY-MM-DD path parameter, or None if it is not a valid date"""
+    if not DATE_DIR_RE.fullmatch(value):
+        return None
+    try:
+        return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+    except ValueError:
+        # Day out of range for the month, e.g. 2024-02-30
+        return None
+
+def _scan_date_dirs(reports_path: Path) -> List[str]:
+    """Sorted names of the date directories under the reports path"""
+    with os.scandir(reports_path) as entries:
+        return sorted(entry.name for entry in entries if entry.is_dir(follow_symlinks=False) and DATE_DIR_RE.match(entry.name))
+
+class _DateIndex:
+    """Cached date directory listing, rescanned when stale or when a date directory is added or removed"""
+    __slots__ = ('dates', 'mtime', 'built_at')
+    
+    def __init__(self):
+        self.dates: List[str] = []
+        self.mtime: Optional[float] = None
+        self.built_at = 0.0
+    
+    async def get(self, reports_path: Path) -> List[str]:
+        """Date directory names in ascending order"""
+        # Creating or removing a date directory changes the parent's mtime
+        mtime = reports_path.stat().st_mtime
+        if mtime != self.mtime or time.monotonic() - self.built_at > DATE_INDEX_TTL:
+            self.dates = await asyncio.to_thread(_scan_date_dirs, reports_path)
+            self.mtime = mtime
+            self.built_at = time.monotonic()
+        return self.dates
+
+date_index = _DateIndex()
+
+# Static part of the status response, built once at import
+REPORTS_API_INFO = {
+    "message": "News Intelligence Reports API v1.0",
+    "status": "operational",
+    "export_formats": settings.EXPORT_FORMATS,
+    "reports_path": settings.REPORTS_BASE_PATH
+}
+
 @router.get("/", summary="Report Management API")
 async def reports_api_status():
     """Get report API status"""
     return {
-        "message": "News Intelligence Reports API v1.0",
-        "status": "operational",
-        "export_formats": settings.EXPORT_FORMATS,
-        "reports_path": settings.REPORTS_BASE_PATH,
+        **REPORTS_API_INFO,
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -32,9 +103,8 @@ async def get_daily_reports(report_date: str):
     """Get all report files for a specific date"""
     try:
         # Parse date
-        try:
-            parsed_date = datetime.strptime(report_date, "%Y-%m-%d").date()
-        except ValueError:
+        parsed_date = _parse_report_date(report_date)
+        if parsed_date is None:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
         
         report_generator = JournalistReportGenerator()
@@ -57,18 +127,57 @@ async def get_daily_reports(report_date: str):
         logger.error(f"Error getting daily reports: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Report retrieval failed: {str(e)}")
 
+@functools.lru_cache(maxsize=64)
+def _story_index(date_dir: str, mtime_ns: int) -> Dict[str, str]:
+    """Story directory names under a date directory keyed by story id, cached per directory mtime"""
+    index = {}
+    with os.scandir(date_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                index.setdefault(entry.name.split('-', 1)[0], entry.name)
+    return index
+
+def _find_story_dir(date_dir: Path, story_id: str) -> Optional[Path]:
+    """Story directory under a date directory for story_id, or the first whose name starts with it"""
+    # Adding a story directory changes the date directory's mtime, which rebuilds the index
+    index = _story_index(str(date_dir), date_dir.stat().st_mtime_ns)
+    name = index.get(story_id)
+    if name is None:
+        name = next((dir_name for dir_name in index.values() if dir_name.startswith(story_id)), None)
+    return date_dir / name if name is not None else None
+
+def _report_file_response(request: Request, path: Path, media_type: str, filename: str) -> Response:
+    """FileResponse with an mtime/size ETag, or 304 Not Modified if the client already has it"""
+    st = path.stat()
+    headers = {
+        "ETag": f'"{int(st.st_mtime)}-{st.st_size}"',
+        "Cache-Control": REPORT_CACHE_CONTROL
+    }
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or
+                          headers["ETag"] in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    
+    return FileResponse(
+        path=str(path),
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        stat_result=st
+    )
+
 @router.get("/download/{report_date}/{story_id}/{file_type}", summary="Download Report File")
 async def download_report_file(
+    request: Request,
     report_date: str,
     story_id: str,
-    file_type: str
+    file_type: ReportFileType
 ):
     """Download a specific report file"""
     try:
         # Validate date format
-        try:
-            datetime.strptime(report_date, "%Y-%m-%d")
-        except ValueError:
+        if _parse_report_date(report_date) is None:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
         
         # Construct file path
@@ -76,25 +185,12 @@ async def download_report_file(
         date_dir = reports_path / report_date
         
         # Find story directory that starts with story_id
-        story_dirs = [d for d in date_dir.iterdir() if d.is_dir() and d.name.startswith(story_id)]
+        story_dir = await asyncio.to_thread(_find_story_dir, date_dir, story_id)
         
-        if not story_dirs:
+        if story_dir is None:
             raise HTTPException(status_code=404, detail=f"Story {story_id} not found for {report_date}")
         
-        story_dir = story_dirs[0]
-        
-        # Map file types to actual filenames
-        file_mapping = {
-            "markdown": "comprehensive-report.md",
-            "briefing": "anchor-briefing.json",
-            "source_analysis": "source-analysis.json",
-            "breakdown": "factual-emotional-breakdown.json"
-        }
-        
-        if file_type not in file_mapping:
-            raise HTTPException(status_code=400, detail=f"Invalid file type. Choose from: {list(file_mapping.keys())}")
-        
-        file_path = story_dir / file_mapping[file_type]
+        file_path = story_dir / REPORT_FILES[file_type]
         
         if not file_path.exists():
             raise HTTPException(status_code=404, detail=f"File {file_type} not found for story {story_id}")
@@ -102,11 +198,7 @@ async def download_report_file(
         # Determine media type
         media_type = "application/json" if file_type != "markdown" else "text/markdown"
         
-        return FileResponse(
-            path=str(file_path),
-            media_type=media_type,
-            filename=f"{story_id}-{file_mapping[file_type]}"
-        )
+        return _report_file_response(request, file_path, media_type, f"{story_id}-{REPORT_FILES[file_type]}")
         
     except HTTPException:
         raise
@@ -115,13 +207,11 @@ async def download_report_file(
         raise HTTPException(status_code=500, detail=f"Download failed: {str(e)}")
 
 @router.get("/summary/{report_date}", summary="Get Daily Summary")
-async def get_daily_summary(report_date: str):
+async def get_daily_summary(request: Request, report_date: str):
     """Get daily summary report"""
     try:
         # Validate date format
-        try:
-            datetime.strptime(report_date, "%Y-%m-%d")
-        except ValueError:
+        if _parse_report_date(report_date) is None:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
         
         # Construct file path
@@ -131,11 +221,7 @@ async def get_daily_summary(report_date: str):
         if not summary_path.exists():
             raise HTTPException(status_code=404, detail=f"Daily summary not found for {report_date}")
         
-        return FileResponse(
-            path=str(summary_path),
-            media_type="text/markdown",
-            filename=f"daily-summary-{report_date}.md"
-        )
+        return _report_file_response(request, summary_path, "text/markdown", f"daily-summary-{report_date}.md")
         
     except HTTPException:
         raise
@@ -156,38 +242,11 @@ async def list_report_dates(limit: int = Query(30, description="Maximum number o
                 "total_dates": 0
             }
         
-        # Get all date directories
-        date_dirs = []
-        for item in reports_path.iterdir():
-            if item.is_dir():
-                try:
-                    # Validate it's a date directory
-                    datetime.strptime(item.name, "%Y-%m-%d")
-                    date_dirs.append(item.name)
-                except ValueError:
-                    continue
-        
-        # Sort dates (newest first)
-        date_dirs.sort(reverse=True)
-        date_dirs = date_dirs[:limit]
-        
-        # Get details for each date
-        date_details = []
-        for date_str in date_dirs:
-            date_path = reports_path / date_str
-            
-            # Count story reports
-            story_count = len([d for d in date_path.iterdir() if d.is_dir()])
-            
-            # Check for summary
-            has_summary = (date_path / "daily-summary.md").exists()
-            
-            date_details.append({
-                "date": date_str,
-                "story_count": story_count,
-                "has_summary": has_summary,
-                "path": str(date_path)
-            })
+        # Newest dates first
+        date_dirs = (await date_index.get(reports_path))[::-1][:limit]
+        
+        # Get details for each date off the event loop
+        date_details = await asyncio.to_thread(_date_details, reports_path, date_dirs)
         
         return {
             "status": "success",
@@ -201,56 +260,89 @@ async def list_report_dates(limit: int = Query(30, description="Maximum number o
         logger.error(f"Error listing report dates: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Date listing failed: {str(e)}")
 
+# Date directory name -> (mtime_ns, details) from the last time it was listed
+_date_details_cache: Dict[str, tuple] = {}
+
+def _date_details(reports_path: Path, date_dirs: List[str]) -> List[Dict[str, Any]]:
+    """Story count and summary presence for each date directory"""
+    date_details = []
+    for date_str in date_dirs:
+        date_path = reports_path / date_str
+        
+        # Adding a story directory or the summary changes the date directory's mtime
+        mtime = date_path.stat().st_mtime_ns
+        cached = _date_details_cache.get(date_str)
+        if cached is not None and cached[0] == mtime:
+            date_details.append(cached[1])
+            continue
+        
+        # Count story reports
+        with os.scandir(date_path) as entries:
+            story_count = sum(1 for entry in entries if entry.is_dir(follow_symlinks=False))
+        
+        # Check for summary
+        has_summary = (date_path / "daily-summary.md").exists()
+        
+        details = {
+            "date": date_str,
+            "story_count": story_count,
+            "has_summary": has_summary,
+            "path": str(date_path)
+        }
+        _date_details_cache[date_str] = (mtime, details)
+        date_details.append(details)
+    return date_details
+
+def _build_preview(report_date: str, story_id: str) -> Dict[str, Any]:
+    """Story directory listing, markdown preview and briefing data for one story"""
+    # Validate date format
+    if _parse_report_date(report_date) is None:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    
+    # Construct file path
+    reports_path = Path(settings.REPORTS_BASE_PATH)
+    date_dir = reports_path / report_date
+    
+    # Find story directory
+    story_dir = _find_story_dir(date_dir, story_id)
+    
+    if story_dir is None:
+        raise HTTPException(status_code=404, detail=f"Story {story_id} not found for {report_date}")
+    markdown_path = story_dir / "comprehensive-report.md"
+    briefing_path = story_dir / "anchor-briefing.json"
+    
+    preview_data = {
+        "story_id": story_id,
+        "report_date": report_date,
+        "story_directory": story_dir.name,
+        "available_files": [],
+        "markdown_preview": None,
+        "briefing_data": None
+    }
+    
+    # List available files
+    with os.scandir(story_dir) as entries:
+        preview_data["available_files"] = [entry.name for entry in entries if entry.is_file(follow_symlinks=False)]
+    
+    # Get markdown preview; one character past the preview tells whether there is more
+    if markdown_path.exists():
+        with open(markdown_path, 'r', encoding='utf-8') as f:
+            content = f.read(1001)
+            preview_data["markdown_preview"] = content[:1000] + "..." if len(content) > 1000 else content
+    
+    # Get briefing data
+    if briefing_path.exists():
+        with open(briefing_path, 'rb') as f:
+            raw = f.read()
+        preview_data["briefing_data"] = orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
+    
+    return preview_data
+
 @router.get("/story-preview/{report_date}/{story_id}", summary="Preview Story Report")
 async def preview_story_report(report_date: str, story_id: str):
     """Get a preview of a story report (first 1000 characters)"""
     try:
-        # Validate date format
-        try:
-            datetime.strptime(report_date, "%Y-%m-%d")
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-        
-        # Construct file path
-        reports_path = Path(settings.REPORTS_BASE_PATH)
-        date_dir = reports_path / report_date
-        
-        # Find story directory
-        story_dirs = [d for d in date_dir.iterdir() if d.is_dir() and d.name.startswith(story_id)]
-        
-        if not story_dirs:
-            raise HTTPException(status_code=404, detail=f"Story {story_id} not found for {report_date}")
-        
-        story_dir = story_dirs[0]
-        markdown_path = story_dir / "comprehensive-report.md"
-        briefing_path = story_dir / "anchor-briefing.json"
-        
-        preview_data = {
-            "story_id": story_id,
-            "report_date": report_date,
-            "story_directory": story_dir.name,
-            "available_files": [],
-            "markdown_preview": None,
-            "briefing_data": None
-        }
-        
-        # List available files
-        for file_path in story_dir.iterdir():
-            if file_path.is_file():
-                preview_data["available_files"].append(file_path.name)
-        
-        # Get markdown preview
-        if markdown_path.exists():
-            with open(markdown_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                preview_data["markdown_preview"] = content[:1000] + "..." if len(content) > 1000 else content
-        
-        # Get briefing data
-        if briefing_path.exists():
-            with open(briefing_path, 'r', encoding='utf-8') as f:
-                preview_data["briefing_data"] = json.load(f)
-        
-        return preview_data
+        return await asyncio.to_thread(_build_preview, report_date, story_id)
         
     except HTTPException:
         raise
@@ -258,6 +350,119 @@ async def preview_story_report(report_date: str, story_id: str):
         logger.error(f"Error previewing story report: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Preview failed: {str(e)}")
 
+class PreviewRef(BaseModel):
+    """One story to preview in a batch request"""
+    date: str
+    story_id: str
+
+class BatchPreviewRequest(BaseModel):
+    """Stories to preview in a single round trip"""
+    items: List[PreviewRef] = Field(..., max_length=MAX_BATCH_PREVIEWS)
+
+async def _batch_preview_item(item: PreviewRef) -> Dict[str, Any]:
+    """Preview for one batch item, with failures reported per item"""
+    try:
+        preview = await asyncio.to_thread(_build_preview, item.date, item.story_id)
+        return {"status": "success", "preview": preview}
+    except HTTPException as e:
+        return {"status": "error", "story_id": item.story_id, "report_date": item.date,
+                "status_code": e.status_code, "detail": e.detail}
+    except Exception as e:
+        logger.error(f"Error previewing story report: {str(e)}")
+        return {"status": "error", "story_id": item.story_id, "report_date": item.date,
+                "status_code": 500, "detail": f"Preview failed: {str(e)}"}
+
+@router.post("/batch", summary="Preview Multiple Story Reports")
+async def batch_preview_story_reports(batch: BatchPreviewRequest):
+    """Previews for several stories at once, in request order"""
+    results = await asyncio.gather(*(_batch_preview_item(item) for item in batch.items))
+    
+    return {
+        "status": "success",
+        "results": results,
+        "total_requested": len(batch.items),
+        "total_found": sum(1 for result in results if result["status"] == "success"),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+def _match_in(content: str, pattern: re.Pattern) -> Optional[tuple]:
+    """Context around the first match and the match count, in one pass over the text"""
+    first = None
+    count = 0
+    for match in pattern.finditer(content):
+        if first is None:
+            first = match.start()
+        count += 1
+    if first is None:
+        return None
+    # Find context around match
+    context = content[max(0, first - 100):min(len(content), first + 200)].strip()
+    return context, count
+
+def _report_paths(date_dirs: List[Path]) -> List[Path]:
+    """Daily summaries and story reports under the given date directories"""
+    paths = []
+    for date_dir in date_dirs:
+        summary_path = date_dir / "daily-summary.md"
+        if summary_path.exists():
+            paths.append(summary_path)
+        with os.scandir(date_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    markdown_path = Path(entry.path) / "comprehensive-report.md"
+                    if markdown_path.exists():
+                        paths.append(markdown_path)
+    return paths
+
+def _scan_report_file(path: Path, pattern: re.Pattern) -> Optional[Dict[str, Any]]:
+    """Search result for one report file, or None if it does not match"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception:
+        return None
+    
+    match = _match_in(content, pattern)
+    if not match:
+        return None
+    context, score = match
+    
+    if path.name == "daily-summary.md":
+        return {
+            "type": "daily_summary",
+            "date": path.parent.name,
+            "file": "daily-summary.md",
+            "context": context,
+            "score": score
+        }
+    
+    # Extract story title from content
+    title = content.split('\n', 1)[0].replace('#', '').strip()
+    story_dir = path.parent
+    return {
+        "type": "story_report",
+        "date": story_dir.parent.name,
+        "story_id": story_dir.name.split('-')[0],
+        "story_title": title,
+        "file": "comprehensive-report.md",
+        "context": context,
+        "score": score
+    }
+
+async def _search_report_files(date_dirs: List[Path], query: str) -> List[Dict[str, Any]]:
+    """Case-insensitive substring search over daily summaries and story reports"""
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    paths = await asyncio.to_thread(_report_paths, date_dirs)
+    
+    # Scan files concurrently in worker threads, a bounded number at a time
+    scan_slots = asyncio.Semaphore(SEARCH_SCAN_CONCURRENCY)
+    
+    async def scan(path: Path) -> Optional[Dict[str, Any]]:
+        async with scan_slots:
+            return await asyncio.to_thread(_scan_report_file, path, pattern)
+    
+    return [result for result in await asyncio.gather(*(scan(path) for path in paths)) if result]
+
 @router.get("/search", summary="Search Reports")
 async def search_reports(
     query: str = Query(..., description="Search term"),
@@ -277,90 +482,28 @@ async def search_reports(
                 "total_found": 0
             }
         
-        # Get date range
-        date_dirs = []
-        for item in reports_path.iterdir():
-            if item.is_dir():
-                try:
-                    item_date = datetime.strptime(item.name, "%Y-%m-%d").date()
-                    
-                    # Apply date filters
-                    if start_date:
-                        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-                        if item_date < start:
-                            continue
-                    
-                    if end_date:
-                        end = datetime.strptime(end_date, "%Y-%m-%d").date()
-                        if item_date > end:
-                            continue
-                    
-                    date_dirs.append(item)
-                except ValueError:
-                    continue
-        
-        # Search through files
-        results = []
-        query_lower = query.lower()
-        
-        for date_dir in date_dirs:
-            # Search daily summary
-            summary_path = date_dir / "daily-summary.md"
-            if summary_path.exists():
-                try:
-                    with open(summary_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if query_lower in content.lower():
-                            # Find context around match
-                            index = content.lower().find(query_lower)
-                            start = max(0, index - 100)
-                            end = min(len(content), index + 200)
-                            context = content[start:end].strip()
-                            
-                            results.append({
-                                "type": "daily_summary",
-                                "date": date_dir.name,
-                                "file": "daily-summary.md",
-                                "context": context,
-                                "score": content.lower().count(query_lower)
-                            })
-                except Exception:
-                    continue
+        # Get date range; an unparseable bound matches no dates
+        try:
+            start = datetime.strptime(start_date, "%Y-%m-%d").date().isoformat() if start_date else None
+            end = datetime.strptime(end_date, "%Y-%m-%d").date().isoformat() if end_date else None
+        except ValueError:
+            start = end = None
+            results = []
+        else:
+            # Ranked lookup in the full-text index (or result cache), already sorted and limited
+            results = await asyncio.to_thread(search_reports_cached, query, start, end, limit)
+        
+        if results is None:
+            # No FTS5 support: scan the report files in worker threads
+            date_dirs = [
+                reports_path / date_str for date_str in await date_index.get(reports_path)
+                if (start is None or date_str >= start) and (end is None or date_str <= end)
+            ]
+            results = await _search_report_files(date_dirs, query)
             
-            # Search story reports
-            for story_dir in date_dir.iterdir():
-                if story_dir.is_dir():
-                    markdown_path = story_dir / "comprehensive-report.md"
-                    if markdown_path.exists():
-                        try:
-                            with open(markdown_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if query_lower in content.lower():
-                                    # Find context around match
-                                    index = content.lower().find(query_lower)
-                                    start = max(0, index - 100)
-                                    end = min(len(content), index + 200)
-                                    context = content[start:end].strip()
-                                    
-                                    # Extract story title from content
-                                    lines = content.split('\n')
-                                    title = lines[0].replace('#', '').strip() if lines else story_dir.name
-                                    
-                                    results.append({
-                                        "type": "story_report",
-                                        "date": date_dir.name,
-                                        "story_id": story_dir.name.split('-')[0],
-                                        "story_title": title,
-                                        "file": "comprehensive-report.md",
-                                        "context": context,
-                                        "score": content.lower().count(query_lower)
-                                    })
-                        except Exception:
-                            continue
-        
-        # Sort by relevance (score) and limit
-        results.sort(key=lambda x: x["score"], reverse=True)
-        results = results[:limit]
+            # Sort by relevance (score) and limit
+            results.sort(key=lambda x: x["score"], reverse=True)
+            results = results[:limit]
         
         return {
             "status": "success",
@@ -378,6 +521,45 @@ async def search_reports(
         logger.error(f"Error searching reports: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
+def _count_stories_and_files(reports_path: Path, dates: List[str]) -> tuple:
+    """Total story directories and report files across the date directories"""
+    total_stories = 0
+    total_files = 0
+    for date_str in dates:
+        with os.scandir(reports_path / date_str) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total_stories += 1
+                    with os.scandir(entry.path) as story_entries:
+                        total_files += sum(1 for story_entry in story_entries if story_entry.is_file(follow_symlinks=False))
+                elif entry.is_file(follow_symlinks=False):
+                    total_files += 1
+    return total_stories, total_files
+
+class _StatsCache:
+    """Cached story and file totals, recounted when stale or when the reports tree visibly changes"""
+    __slots__ = ('key', 'counts', 'built_at')
+    
+    def __init__(self):
+        self.key: Optional[tuple] = None
+        self.counts = (0, 0)
+        self.built_at = 0.0
+    
+    async def get(self, reports_path: Path, dates: List[str]) -> tuple:
+        """(total_stories, total_files) across the date directories"""
+        # New date directories change the reports path; new stories land in the newest date directory
+        key = (
+            reports_path.stat().st_mtime_ns,
+            (reports_path / dates[-1]).stat().st_mtime_ns if dates else None
+        )
+        if key != self.key or time.monotonic() - self.built_at > DATE_INDEX_TTL:
+            self.counts = await asyncio.to_thread(_count_stories_and_files, reports_path, dates)
+            self.key = key
+            self.built_at = time.monotonic()
+        return self.counts
+
+stats_cache = _StatsCache()
+
 @router.get("/stats", summary="Get Report Statistics")
 async def get_report_stats():
     """Get statistics about generated reports"""
@@ -395,35 +577,14 @@ async def get_report_stats():
                 }
             }
         
-        # Collect statistics
-        total_days = 0
-        total_stories = 0
-        total_files = 0
-        dates = []
-        
-        for date_dir in reports_path.iterdir():
-            if date_dir.is_dir():
-                try:
-                    # Validate date
-                    datetime.strptime(date_dir.name, "%Y-%m-%d")
-                    dates.append(date_dir.name)
-                    total_days += 1
-                    
-                    # Count stories and files
-                    for story_dir in date_dir.iterdir():
-                        if story_dir.is_dir():
-                            total_stories += 1
-                            total_files += len([f for f in story_dir.iterdir() if f.is_file()])
-                        elif story_dir.is_file():
-                            total_files += 1
-                            
-                except ValueError:
-                    continue
+        # Collect statistics off the event loop, reusing them while the tree is unchanged
+        dates = await date_index.get(reports_path)
+        total_days = len(dates)
+        total_stories, total_files = await stats_cache.get(reports_path, dates)
         
         # Date range
         date_range = None
         if dates:
-            dates.sort()
             date_range = {
                 "earliest": dates[0],
                 "latest": dates[-1]
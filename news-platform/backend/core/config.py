@@ -2,7 +2,8 @@
 News Intelligence Platform - Core Configuration
 """
 import os
-from typing import List, Dict
+from functools import cached_property
+from typing import Dict, Tuple
 try:
     from pydantic_settings import BaseSettings
 except ImportError:
@@ -29,6 +30,10 @@ class Settings(BaseSettings):
     REPORTS_BASE_PATH: str = "/app/news-platform/data/reports"
     EXPORT_FORMATS: str = "markdown,pdf,json"  # Will be split into list
     
+    # Report search: reuse cached results for reworded queries (needs sentence-transformers)
+    SEMANTIC_SEARCH_CACHE: bool = False
+    SEMANTIC_SEARCH_MODEL: str = "all-MiniLM-L6-v2"
+    
     # Impact Assessment (Placeholder for your data science machine)
     IMPACT_ASSESSMENT_ENABLED: bool = False  # Your module will enable this
     IMPACT_ASSESSMENT_ENDPOINT: str = ""  # Your service endpoint
@@ -40,10 +45,10 @@ class Settings(BaseSettings):
     # Processing Configuration
     ENABLE_MANUAL_PROCESSING: bool = True  # Allow manual triggers for testing
     
-    @property
-    def export_formats_list(self) -> List[str]:
-        """Convert export formats string to list"""
-        return [fmt.strip() for fmt in self.EXPORT_FORMATS.split(",")]
+    @cached_property
+    def export_formats_list(self) -> Tuple[str, ...]:
+        """Export formats string split into a tuple, computed on first access"""
+        return tuple(fmt.strip() for fmt in self.EXPORT_FORMATS.split(","))
     
     class Config:
         env_file = ".env"
@@ -7,9 +7,16 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 
+# Serialize responses with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Import API routers
 from api.news_endpoints import router as news_router
 from api.report_endpoints import router as reports_router
@@ -71,7 +78,8 @@ app = FastAPI(
     title="News Intelligence Platform",
     description="Automated news aggregation, analysis, and professional report generation for news anchors",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # Configure CORS
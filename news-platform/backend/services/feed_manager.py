@@ -18,6 +18,9 @@ from utils.content_extractor import ContentExtractor
 
 logger = logging.getLogger(__name__)
 
+# RSS feeds fetched at once while polling
+FEED_POLL_CONCURRENCY = 10
+
 class NewsFeedManager:
     """Manages polling of free RSS feeds and article extraction"""
     
@@ -25,19 +28,31 @@ class NewsFeedManager:
         self.content_extractor = ContentExtractor()
         self.seen_urls = set()  # Simple deduplication
         
-    async def poll_all_feeds(self) -> List[NewsArticle]:
-        """Poll all configured RSS feeds and return new articles"""
+    async def poll_all_feeds(self, feeds: Optional[List[Dict]] = None) -> List[NewsArticle]:
+        """Poll all configured RSS feeds (or just the given ones) concurrently and return new articles"""
+        if feeds is None:
+            feeds = FREE_NEWS_SOURCES["rss_feeds"]
         all_articles = []
         
-        for feed_config in FREE_NEWS_SOURCES["rss_feeds"]:
-            try:
-                logger.info(f"Polling feed: {feed_config['name']}")
-                articles = await self._poll_single_feed(feed_config)
-                all_articles.extend(articles)
-                logger.info(f"Got {len(articles)} articles from {feed_config['name']}")
-            except Exception as e:
-                logger.error(f"Error polling {feed_config['name']}: {str(e)}")
+        poll_slots = asyncio.Semaphore(FEED_POLL_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=settings.CONTENT_EXTRACTION_TIMEOUT)
+        
+        async with aiohttp.ClientSession(timeout=timeout, headers=self.content_extractor.headers) as session:
+            async def poll(feed_config: Dict) -> List[NewsArticle]:
+                async with poll_slots:
+                    logger.info(f"Polling feed: {feed_config['name']}")
+                    articles = await self._poll_single_feed(feed_config, session)
+                    logger.info(f"Got {len(articles)} articles from {feed_config['name']}")
+                    return articles
+            
+            # One slow or failing feed does not hold up or abort the others
+            results = await asyncio.gather(*(poll(feed_config) for feed_config in feeds), return_exceptions=True)
+        
+        for feed_config, result in zip(feeds, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error polling {feed_config['name']}: {str(result)}")
                 continue
+            all_articles.extend(result)
                 
         # Deduplicate articles
         unique_articles = self._deduplicate_articles(all_articles)
@@ -45,13 +60,18 @@ class NewsFeedManager:
         
         return unique_articles
     
-    async def _poll_single_feed(self, feed_config: Dict) -> List[NewsArticle]:
+    async def _poll_single_feed(self, feed_config: Dict, session: aiohttp.ClientSession) -> List[NewsArticle]:
         """Poll a single RSS feed"""
         articles = []
         
         try:
-            # Parse RSS feed
-            feed = feedparser.parse(feed_config["url"])
+            # Fetch the feed, then parse it off the event loop
+            async with session.get(feed_config["url"]) as response:
+                if response.status >= 400:
+                    logger.warning(f"HTTP {response.status} for feed {feed_config['name']}")
+                    return articles
+                data = await response.read()
+            feed = await asyncio.to_thread(feedparser.parse, data)
             
             if feed.bozo:
                 logger.warning(f"Feed parsing issues for {feed_config['name']}: {feed.bozo_exception}")
@@ -172,15 +192,24 @@ class NewsFeedManager:
                     
         return unique_articles
     
-    async def get_articles_by_timeframe(self, hours: int = 24) -> List[NewsArticle]:
-        """Get articles from the last N hours"""
+    async def get_articles_by_timeframe(self, hours: int = 24, source: Optional[str] = None,
+                                        limit: Optional[int] = None) -> List[NewsArticle]:
+        """Get articles from the last N hours, optionally from one source and capped at limit"""
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        articles = await self.poll_all_feeds()
         
-        return [
+        # Only poll the requested source's feeds rather than filtering afterwards
+        feeds = None
+        if source:
+            feeds = [feed for feed in FREE_NEWS_SOURCES["rss_feeds"] if feed["name"] == source]
+            if not feeds:
+                return []
+        articles = await self.poll_all_feeds(feeds)
+        
+        recent = [
             article for article in articles 
             if article.published_at >= cutoff_time
         ]
+        return recent[:limit] if limit is not None else recent
 
 # External API Placeholders (ready for when you get API keys)
 class ExternalNewsAPIs:
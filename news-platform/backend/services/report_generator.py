@@ -16,6 +16,7 @@ from pathlib import Path
 
 from models.news_models import StoryCluster, NewsAnalysis, DailyReport
 from core.config import settings
+from services.report_search import report_index
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,7 @@ class JournalistReportGenerator:
         markdown_path = story_dir / "comprehensive-report.md"
         with open(markdown_path, 'w', encoding='utf-8') as f:
             f.write(markdown_content)
+        report_index.index_file(markdown_path)
         file_paths["markdown"] = str(markdown_path)
         
         # Generate anchor briefing (JSON)
@@ -405,6 +407,7 @@ class JournalistReportGenerator:
         
         with open(summary_path, 'w', encoding='utf-8') as f:
             f.write(summary_content)
+        report_index.index_file(summary_path)
         
         return str(summary_path)
     
@@ -428,6 +431,11 @@ class JournalistReportGenerator:
         
         date_dir = self.reports_base_path / str(report_date)
         
+        # Walk the directory in a worker thread so it does not block the event loop
+        return await asyncio.to_thread(self._list_report_files, date_dir)
+    
+    def _list_report_files(self, date_dir: Path) -> Dict[str, List[str]]:
+        """Story, summary and data files under one date directory"""
         if not date_dir.exists():
             return {}
         
@@ -437,21 +445,21 @@ class JournalistReportGenerator:
             "data_files": []
         }
         
-        for item in date_dir.iterdir():
-            if item.is_dir():
-                # Story directory
-                story_files = []
-                for file in item.iterdir():
-                    if file.is_file():
-                        story_files.append(str(file))
-                report_files["story_reports"].append({
-                    "story_dir": str(item),
-                    "files": story_files
-                })
-            elif item.is_file():
-                if "summary" in item.name:
-                    report_files["summary_files"].append(str(item))
-                else:
-                    report_files["data_files"].append(str(item))
+        with os.scandir(date_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Story directory
+                    with os.scandir(entry.path) as story_entries:
+                        story_files = [story_entry.path for story_entry in story_entries
+                                       if story_entry.is_file(follow_symlinks=False)]
+                    report_files["story_reports"].append({
+                        "story_dir": entry.path,
+                        "files": story_files
+                    })
+                elif entry.is_file(follow_symlinks=False):
+                    if "summary" in entry.name:
+                        report_files["summary_files"].append(entry.path)
+                    else:
+                        report_files["data_files"].append(entry.path)
         
         return report_files
\ No newline at end of file
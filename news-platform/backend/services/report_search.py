@@ -0,0 +1,299 @@
+"""
+News Intelligence Platform - Report Search Index
+SQLite FTS5 full-text index over generated Markdown reports
+"""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+import logging
+import os
+
+from core.config import settings
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    HAVE_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAVE_SENTENCE_TRANSFORMERS = False
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILENAME = "daily-summary.md"
+STORY_REPORT_FILENAME = "comprehensive-report.md"
+
+class ReportSearchIndex:
+    """
+    Full-text index of daily summaries and story reports
+    Reports are indexed as they are written; files added, changed or removed on disk by
+    anything else are picked up by the next search after the report directories change
+    """
+
+    INDEX_FILENAME = "search-index.sqlite"
+
+    def __init__(self, reports_base_path: Path):
+        self.reports_base_path = Path(reports_base_path)
+        self.db_path = self.reports_base_path / self.INDEX_FILENAME
+        self.available = True    # False when SQLite was built without FTS5
+        self.generation = 0      # Bumped whenever indexed content changes
+        self._disk_signature = None    # Directory mtimes as of the last sync
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, creating its tables if needed"""
+        self.reports_base_path.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS reports USING fts5("
+            "date UNINDEXED, kind UNINDEXED, story_id UNINDEXED, title UNINDEXED, "
+            "file UNINDEXED, path UNINDEXED, content, tokenize='porter unicode61')"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS indexed_files (path TEXT PRIMARY KEY, mtime REAL)")
+        return conn
+
+    def _upsert(self, conn: sqlite3.Connection, path: Path, mtime: float):
+        """Replace the indexed copy of one report file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        if path.name == SUMMARY_FILENAME:
+            row = (path.parent.name, "daily_summary", None, None)
+        else:
+            # Story title is the report's first heading
+            lines = content.split('\n')
+            title = lines[0].replace('#', '').strip() if lines else path.parent.name
+            row = (path.parent.parent.name, "story_report", path.parent.name.split('-')[0], title)
+
+        conn.execute("DELETE FROM reports WHERE path = ?", (str(path),))
+        conn.execute(
+            "INSERT INTO reports (date, kind, story_id, title, file, path, content) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (*row, path.name, str(path), content)
+        )
+        conn.execute("INSERT OR REPLACE INTO indexed_files (path, mtime) VALUES (?, ?)", (str(path), mtime))
+
+    def index_file(self, path: Path):
+        """Index a report file that has just been written"""
+        if not self.available:
+            return
+        try:
+            path = Path(path)
+            with self._lock, closing(self._connect()) as conn:
+                self._upsert(conn, path, path.stat().st_mtime)
+                conn.commit()
+                self.generation += 1
+        except sqlite3.OperationalError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.error(f"Error indexing report {path}: {str(e)}")
+
+    def _current_disk_signature(self) -> Optional[tuple]:
+        """Modification times of the reports root and its date directories"""
+        # Adding or removing a date directory, a story directory or a daily summary changes
+        # one of these; reports the generator writes are also indexed directly
+        try:
+            with os.scandir(self.reports_base_path) as entries:
+                dates = sorted(
+                    (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir()
+                )
+            return self.reports_base_path.stat().st_mtime_ns, tuple(dates)
+        except OSError:
+            return None
+
+    def refresh(self):
+        """Sync with the files on disk if the report directories changed since the last sync"""
+        signature = self._current_disk_signature()
+        if signature is None or signature != self._disk_signature:
+            self.sync(signature)
+
+    def sync(self, signature: Optional[tuple] = None):
+        """Bring the index in line with the report files on disk"""
+        with self._lock, closing(self._connect()) as conn:
+            indexed = dict(conn.execute("SELECT path, mtime FROM indexed_files"))
+            on_disk = set()
+            changed = False
+
+            for pattern in (f"*/{SUMMARY_FILENAME}", f"*/*/{STORY_REPORT_FILENAME}"):
+                for path in self.reports_base_path.glob(pattern):
+                    key = str(path)
+                    try:
+                        mtime = path.stat().st_mtime
+                    except OSError:
+                        # Removed since the glob listed it; dropped from the index below
+                        continue
+                    on_disk.add(key)
+                    if indexed.get(key) != mtime:
+                        try:
+                            self._upsert(conn, path, mtime)
+                            changed = True
+                        except (OSError, UnicodeDecodeError) as e:
+                            logger.warning(f"Skipping unreadable report {path}: {str(e)}")
+
+            # Drop reports that were deleted from disk
+            for key in indexed.keys() - on_disk:
+                conn.execute("DELETE FROM reports WHERE path = ?", (key,))
+                conn.execute("DELETE FROM indexed_files WHERE path = ?", (key,))
+                changed = True
+
+            conn.commit()
+            if changed:
+                self.generation += 1
+            # Taken before the scan, so changes made during it trigger another sync
+            self._disk_signature = signature
+
+    def search(self, query: str, start_date: Optional[str], end_date: Optional[str],
+               limit: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Ranked full-text search within an inclusive YYYY-MM-DD date range
+
+        Returns None when FTS5 is unavailable so callers can fall back to scanning files
+        """
+        if not self.available:
+            return None
+
+        # Search the whole query as one phrase so FTS5 operators in user input are inert.
+        # Terms are matched after porter stemming, and the last one also as a prefix so a
+        # partially typed word still matches; unlike the file scan fallback, text inside
+        # a word (e.g. "ccine" for "vaccine") does not match
+        phrase = '"' + query.replace('"', '""') + '"*'
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT kind, date, story_id, title, file, "
+                    "snippet(reports, 6, '', '', '...', 48), bm25(reports) "
+                    "FROM reports WHERE reports MATCH ? AND date BETWEEN ? AND ? "
+                    "ORDER BY bm25(reports) LIMIT ?",
+                    (phrase, start_date or "0000-00-00", end_date or "9999-99-99", limit)
+                ).fetchall()
+        except sqlite3.OperationalError as e:
+            if "fts5" in str(e):
+                self._disable(e)
+                return None
+            # Queries with no searchable terms are not valid FTS5 syntax
+            logger.warning(f"Report search failed for {query!r}: {str(e)}")
+            return []
+
+        results = []
+        for kind, report_date, story_id, title, file_name, context, rank in rows:
+            result = {
+                "type": kind,
+                "date": report_date,
+                "file": file_name,
+                "context": context,
+                # bm25 ranks better matches lower; report higher-is-better scores
+                "score": -rank
+            }
+            if kind == "story_report":
+                result["story_id"] = story_id
+                result["story_title"] = title
+            results.append(result)
+
+        return results
+
+    def _disable(self, error: Exception):
+        """Turn the index off when SQLite lacks FTS5"""
+        if "fts5" in str(error):
+            logger.warning(f"SQLite FTS5 unavailable, report search will scan files: {str(error)}")
+            self.available = False
+        else:
+            logger.error(f"Report index error: {str(error)}")
+
+class SearchResultCache:
+    """
+    Thread-safe LRU cache of report search results with per-entry expiry
+    Entries are tied to the index generation, so any newly indexed report invalidates them.
+    With SEMANTIC_SEARCH_CACHE enabled and sentence-transformers installed, a reworded
+    query whose embedding is close enough to a cached one reuses that query's results.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600, similarity_threshold: float = 0.9):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._model = None
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def _embed(self, query: str):
+        """Unit-length query embedding, or None when semantic matching is off"""
+        if not (settings.SEMANTIC_SEARCH_CACHE and HAVE_SENTENCE_TRANSFORMERS):
+            return None
+        if self._model is None:
+            self._model = SentenceTransformer(settings.SEMANTIC_SEARCH_MODEL)
+        return self._model.encode(query, normalize_embeddings=True)
+
+    def get(self, query: str, scope: tuple, generation: int):
+        """Cached results for this query and scope, plus the query embedding for a later set()"""
+        key = (self._normalize(query), scope)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_generation, _, results = entry
+                if expires_at >= now and entry_generation == generation:
+                    self._entries.move_to_end(key)
+                    return list(results), None
+                del self._entries[key]
+
+        embedding = self._embed(query)
+        if embedding is None:
+            return None, None
+
+        with self._lock:
+            best_key, best_similarity = None, self.similarity_threshold
+            for entry_key, (expires_at, entry_generation, entry_embedding, _) in self._entries.items():
+                if (entry_key[1] != scope or entry_generation != generation
+                        or expires_at < now or entry_embedding is None):
+                    continue
+                similarity = float(np.dot(embedding, entry_embedding))
+                if similarity >= best_similarity:
+                    best_key, best_similarity = entry_key, similarity
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+                return list(self._entries[best_key][3]), embedding
+        return None, embedding
+
+    def set(self, query: str, scope: tuple, generation: int, results: List[Dict[str, Any]], embedding=None):
+        key = (self._normalize(query), scope)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, generation, embedding, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+# Global index and result cache instances
+report_index = ReportSearchIndex(Path(settings.REPORTS_BASE_PATH))
+search_cache = SearchResultCache()
+
+def search_reports_cached(query: str, start_date: Optional[str], end_date: Optional[str],
+                          limit: int) -> Optional[List[Dict[str, Any]]]:
+    """Indexed report search behind the result cache; None when FTS5 is unavailable"""
+    if not report_index.available:
+        return None
+
+    # Pick up reports changed on disk before reading the generation, so cached results
+    # from before the change are never served
+    try:
+        report_index.refresh()
+    except sqlite3.OperationalError as e:
+        report_index._disable(e)
+        if not report_index.available:
+            return None
+    scope = (start_date, end_date, limit)
+    generation = report_index.generation
+    results, embedding = search_cache.get(query, scope, generation)
+    if results is not None:
+        return results
+
+    results = report_index.search(query, start_date, end_date, limit)
+    if results is not None:
+        search_cache.set(query, scope, generation, results, embedding)
+    return results